@@ -7,13 +7,48 @@ im gesamten System und verhindert Dateninkonsistenzen durch mehrfache Instanzen.
 """
 
 import os
+import copy
 import yaml
 import logging
 from typing import Dict, Any, Optional
 
+# libyaml-Backend verwenden, falls verfügbar (sonst reine Python-Implementierung)
+try:
+    from yaml import CSafeLoader as YamlLoader, CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeLoader as YamlLoader, SafeDumper as YamlDumper
+
 # Vorwärtsimport, um zirkuläre Abhängigkeiten zu vermeiden
 from .config_defaults import create_default_config, ensure_directories_exist
 
+# Bereits geparste Konfigurationen, Schlüssel: (Pfad, mtime_ns, Dateigröße);
+# enthält eigene Kopien, damit Änderungen an app.config den Cache nicht verfälschen
+_CONFIG_CACHE: Dict[tuple, Dict[str, Any]] = {}
+
+def _config_cache_key(config_path: str) -> tuple:
+    """
+    Erstellt den Cache-Schlüssel für eine Konfigurationsdatei
+    
+    Args:
+        config_path: Pfad zur Konfigurationsdatei
+        
+    Returns:
+        tuple: (Pfad, Änderungszeit in ns, Dateigröße)
+    """
+    stat = os.stat(config_path)
+    return (os.path.abspath(config_path), stat.st_mtime_ns, stat.st_size)
+
+def _invalidate_config_cache(config_path: str) -> None:
+    """
+    Entfernt alle zwischengespeicherten Stände einer Konfigurationsdatei
+    
+    Args:
+        config_path: Pfad zur Konfigurationsdatei
+    """
+    path = os.path.abspath(config_path)
+    for key in [key for key in _CONFIG_CACHE if key[0] == path]:
+        del _CONFIG_CACHE[key]
+
 class ConfigManager:
     """
     Verwaltet die Konfiguration des MaehrDocs-Systems als Singleton
@@ -93,9 +128,19 @@ class ConfigManager:
                 self._config = create_default_config()
                 self.save_config(self._config)
             else:
+                # Unveränderte Datei nicht erneut parsen
+                cache_key = _config_cache_key(self.config_path)
+                cached = _CONFIG_CACHE.get(cache_key)
+                if cached is not None:
+                    self._config = copy.deepcopy(cached)
+                    return
+                
                 with open(self.config_path, 'r', encoding='utf-8') as file:
-                    self._config = yaml.safe_load(file)
+                    self._config = yaml.load(file, Loader=YamlLoader)
                     self.logger.info(f"Konfiguration aus {self.config_path} geladen.")
+                
+                _invalidate_config_cache(self.config_path)
+                _CONFIG_CACHE[cache_key] = copy.deepcopy(self._config)
         except Exception as e:
             self.logger.error(f"Fehler beim Laden der Konfiguration: {str(e)}")
             self.logger.info("Verwende Standardkonfiguration.")
@@ -112,7 +157,7 @@ class ConfigManager:
             dict: Die neu geladene Konfiguration
         """
         self._config = None  # Zurücksetzen, damit beim nächsten Zugriff neu geladen wird
-        return self.config
+        return self.config  # Unveränderte Dateien kommen aus dem Cache
     
     def save_config(self, config: Dict[str, Any]) -> bool:
         """
@@ -125,12 +170,17 @@ class ConfigManager:
             bool: True bei Erfolg, False bei Fehler
         """
         try:
+            # Vollständig im Speicher serialisieren und mit einem einzigen write() schreiben
+            data = yaml.dump(config, Dumper=YamlDumper, default_flow_style=False, allow_unicode=True)
             with open(self.config_path, 'w', encoding='utf-8') as file:
-                yaml.dump(config, file, default_flow_style=False, allow_unicode=True)
-                self.logger.info(f"Konfiguration in {self.config_path} gespeichert.")
+                file.write(data)
+            self.logger.info(f"Konfiguration in {self.config_path} gespeichert.")
             
-            # Aktualisiere die interne Konfiguration
+            # Aktualisiere die interne Konfiguration und den Cache für den neuen Dateistand
             self._config = config
+            _invalidate_config_cache(self.config_path)
+            cache_key = _config_cache_key(self.config_path)
+            _CONFIG_CACHE[cache_key] = copy.deepcopy(config)
             return True
             
         except Exception as e:
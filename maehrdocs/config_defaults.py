@@ -57,7 +57,8 @@ def create_default_config() -> Dict[str, Any]:
             "show_duplicate_popup": True,
             "notify_on_completion": True,
             "enable_sounds": False,
-            "notify_on_new_documents": True
+            "notify_on_new_documents": True,
+            "log_max_lines": 5000
         }
     }
 
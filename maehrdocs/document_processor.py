@@ -12,6 +12,7 @@ Diese Klasse koordiniert den gesamten Dokumentenverarbeitungsprozess:
 """
 
 import os
+import json
 import logging
 import time
 
@@ -189,10 +190,14 @@ class DocumentProcessor:
                             is_duplicate = True
                             duplicate_path = compare_path
                             
-                            # Spezielle Nachricht für Duplikaterkennung mit speziellem Präfix
-                            message = f"DUPLIKAT_ERKANNT|{filename}|{os.path.basename(file_path)}|{similarity:.2f}"
-                            print(message)  # Diese Zeile ist wichtig für die Erkennung im Stdout
-                            self.logger.info(message)
+                            # Strukturierte Duplikatmeldung mit JSON-Präfix für die GUI
+                            payload = json.dumps({
+                                'orig': filename,
+                                'dup': os.path.basename(file_path),
+                                'sim': round(similarity, 2)
+                            })
+                            print(f"DUPLIKAT_ERKANNT_JSON:{payload}")  # Diese Zeile ist wichtig für die Erkennung im Stdout
+                            self.logger.info(f"DUPLIKAT_ERKANNT|{filename}|{os.path.basename(file_path)}|{similarity:.2f}")
                             
                             break
             
@@ -84,23 +84,15 @@ __all__ = [
 
 # Zu ergänzen in gui/__init__.py
 from .gui_statistics import create_statistics_panel
-from .gui_statistics_data import collect_data
-from .gui_statistics_charts_backup import create_chart_figure
+from .gui_statistics_data import collect_data, collect_data_async
 
 # Exportiere die neuen Funktionen
 __all__.extend([
     'create_statistics_panel',
     'collect_data',
-    'create_chart_figure'
+    'collect_data_async'
 ])
 
-# Statistik-Komponenten importieren
-from .gui_statistics import create_statistics_panel
-
-# Exportiere die neuen Funktionen (falls eine __all__ Liste vorhanden ist)
-if '__all__' in locals() or '__all__' in globals():
-    __all__.extend(['create_statistics_panel'])
-
     # Zu ergänzen in gui/__init__.py
 from .gui_charts_manager import ChartManager
 from .gui_charts_core import create_chart_figure, add_tooltip, create_detail_dialog
@@ -56,7 +56,7 @@ def fade_in(window, alpha=0):
     
     return window
 
-def fade_out(window, alpha=1.0, destroy_window=True):
+def fade_out(window, alpha=1.0, destroy_window=True, on_done=None):
     """
     Führt einen Fade-Out-Effekt für ein Fenster durch.
     
@@ -68,6 +68,8 @@ def fade_out(window, alpha=1.0, destroy_window=True):
         window: Das Fenster
         alpha (float): Aktueller Alpha-Wert (Transparenz), Startwert
         destroy_window (bool): Ob das Fenster nach dem Fade-Out zerstört werden soll
+        on_done (callable): Optionaler Callback nach Abschluss, wenn das Fenster
+            nicht zerstört wird
         
     Returns:
         Das Fenster-Objekt oder None, wenn es zerstört wurde
@@ -81,10 +83,12 @@ def fade_out(window, alpha=1.0, destroy_window=True):
         window.attributes("-alpha", alpha)
         
         # Nach 20ms erneut aufrufen
-        window.after(20, lambda: fade_out(window, alpha, destroy_window))
+        window.after(20, lambda: fade_out(window, alpha, destroy_window, on_done))
     elif destroy_window:
         # Fenster zerstören
         window.destroy()
         return None
+    elif on_done is not None:
+        on_done()
     
     return window
\ No newline at end of file
@@ -4,12 +4,24 @@ Enthält Funktionen für komplexere Chart-Typen wie Kreisdiagramme für Absender
 und Liniendiagramme für Zeitverläufe.
 """
 
+import heapq
 import logging
-import matplotlib
 import matplotlib.dates as mdates
 from datetime import datetime
+from functools import lru_cache
 from . import gui_charts_core as core
 
+# Angepasste Farbpalette für bessere Sichtbarkeit im Dark Mode (Absender-Chart)
+SENDER_COLORS = (
+    '#3498db', '#2ecc71', '#e74c3c', '#f39c12', '#9b59b6',
+    '#34495e', '#16a085', '#e67e22', '#8e44ad', '#2980b9'
+)
+
+# Ab dieser Anzahl an Datenpunkten werden nur die größten Werte beschriftet
+TIMELINE_LABEL_LIMIT = 20
+# Anzahl der beschrifteten Datenpunkte bei langen Zeitverläufen
+TIMELINE_TOP_LABELS = 5
+
 def update_sender_chart(ax, data, app, figure):
     """
     Aktualisiert ein Achsenobjekt mit einem Kreisdiagramm zur Visualisierung der 
@@ -22,21 +34,8 @@ def update_sender_chart(ax, data, app, figure):
             core.handle_empty_data(ax, app, "Keine Absenderdaten verfügbar")
             return
         
-        # Nach Anzahl sortieren (absteigend)
-        sorted_senders = dict(sorted(senders.items(), key=lambda item: item[1], reverse=True))
-        
-        # Begrenzen auf die Top 10
-        if len(sorted_senders) > 10:
-            top_senders = dict(list(sorted_senders.items())[:9])
-            other_count = sum(dict(list(sorted_senders.items())[9:]).values())
-            top_senders["Andere"] = other_count
-            sorted_senders = top_senders
-        
-        # Angepasste Farbpalette für bessere Sichtbarkeit im Dark Mode
-        colors = [
-            '#3498db', '#2ecc71', '#e74c3c', '#f39c12', '#9b59b6',
-            '#34495e', '#16a085', '#e67e22', '#8e44ad', '#2980b9'
-        ]
+        # Nach Anzahl sortieren (absteigend) und auf die Top 10 begrenzen
+        sorted_senders = core.limit_top_entries(senders)
         
         # Kreisdiagramm erstellen
         wedges, texts, autotexts = ax.pie(
@@ -44,22 +43,11 @@ def update_sender_chart(ax, data, app, figure):
             labels=None,  # Labels in der Legende
             autopct='%1.1f%%',
             textprops={'color': 'white', 'fontweight': 'bold', 'fontsize': 10},
-            colors=colors[:len(sorted_senders)],
-            wedgeprops={'width': 0.5, 'edgecolor': app.colors["background_dark"], 'linewidth': 1}
+            colors=SENDER_COLORS[:len(sorted_senders)],
+            # Kräftigere Kante statt Pfadeffekten für die Abgrenzung der Segmente
+            wedgeprops={'width': 0.5, 'edgecolor': app.colors["background_dark"], 'linewidth': 1.5}
         )
         
-        # Schatten für bessere Sichtbarkeit
-        for w in wedges:
-            w.set_path_effects([
-                matplotlib.patheffects.withStroke(linewidth=2, foreground=app.colors["background_dark"])
-            ])
-        
-        # Prozent-Beschriftung optimieren
-        for autotext in autotexts:
-            autotext.set_path_effects([
-                matplotlib.patheffects.withStroke(linewidth=2, foreground=app.colors["background_dark"])
-            ])
-        
         # Legende mit Dark Theme
         legend = ax.legend(
             wedges,
@@ -78,9 +66,6 @@ def update_sender_chart(ax, data, app, figure):
         # Dark Theme anwenden
         core.apply_dark_theme(ax, app, figure)
         
-        # Layout anpassen
-        figure.tight_layout()
-        
         # Daten im Chart-Objekt speichern für Interaktivität
         ax.sender_data = sorted_senders
         ax.documents = data.get("documents", [])
@@ -110,7 +95,7 @@ def update_timeline_chart(ax, data, app, figure):
         
         for date_str, count in sorted(timeline.items()):
             try:
-                date_obj = datetime.strptime(date_str, "%Y-%m-%d")
+                date_obj = _parse_date_key(date_str)
                 dates.append(date_obj)
                 counts.append(count)
                 date_dict[date_obj] = date_str
@@ -143,25 +128,14 @@ def update_timeline_chart(ax, data, app, figure):
         ax.grid(True, linestyle='--', alpha=0.1, color=app.colors["text_secondary"])
         ax.set_axisbelow(True)
         
-        # Datumsformatierung
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
-        
-        # Wenn mehr als 7 Datumspunkte, automatische Locator
-        if len(dates) > 7:
-            ax.xaxis.set_major_locator(mdates.AutoDateLocator())
-        
-        # Datenpunkte beschriften
-        for i, (date, count) in enumerate(zip(dates, counts)):
-            if count > 0:
-                ax.text(date, count,
-                       f'{int(count)}',
-                       ha='center', va='bottom',
-                       color=app.colors["text_primary"],
-                       fontsize=10,
-                       bbox=dict(boxstyle="round,pad=0.3", 
-                                facecolor=app.colors["background_medium"], 
-                                alpha=0.8,
-                                edgecolor='none'))
+        # Kompakte Datumsformatierung; die kurzen Beschriftungen brauchen keine Rotation
+        locator = mdates.AutoDateLocator(minticks=4, maxticks=8)
+        ax.xaxis.set_major_locator(locator)
+        ax.xaxis.set_major_formatter(mdates.ConciseDateFormatter(locator))
+        
+        # Datenpunkte beschriften (bei langen Zeitverläufen nur die größten Werte)
+        for index in _labelled_indices(counts):
+            _create_timeline_label(ax, app, dates[index], counts[index])
         
         # Beschriftungen
         ax.set_title("Dokumentenaufkommen im Zeitverlauf", fontsize=14, color=app.colors["text_primary"])
@@ -171,12 +145,6 @@ def update_timeline_chart(ax, data, app, figure):
         # Dark Theme anwenden
         core.apply_dark_theme(ax, app, figure)
         
-        # Beschriftungen rotieren
-        figure.autofmt_xdate(rotation=45)
-        
-        # Layout anpassen
-        figure.tight_layout()
-        
         # Daten im Chart-Objekt speichern für Interaktivität
         ax.timeline_data = timeline
         ax.dates = dates
@@ -187,4 +155,60 @@ def update_timeline_chart(ax, data, app, figure):
     except Exception as e:
         logger = logging.getLogger(__name__)
         logger.error(f"Fehler beim Aktualisieren des Zeitverlauf-Charts: {str(e)}")
-        core.handle_empty_data(ax, app, f"Fehler bei Zeitdarstellung: {type(e).__name__}")
\ No newline at end of file
+        core.handle_empty_data(ax, app, f"Fehler bei Zeitdarstellung: {type(e).__name__}")
+
+# Datumsschlüssel wiederholen sich über Aktualisierungen hinweg
+@lru_cache(maxsize=4096)
+def _parse_date_key(date_str):
+    """
+    Wandelt einen Datumsschlüssel im Format YYYY-MM-DD in ein datetime-Objekt um.
+    
+    Args:
+        date_str: Datumsschlüssel aus den Zeitverlaufsdaten
+        
+    Returns:
+        datetime: Das Datum (ValueError bei ungültigem Format)
+    """
+    return datetime.fromisoformat(date_str)
+
+def _labelled_indices(counts):
+    """
+    Bestimmt die Datenpunkte, die eine Wertbeschriftung erhalten.
+    
+    Bei mehr als TIMELINE_LABEL_LIMIT Datenpunkten werden nur die
+    TIMELINE_TOP_LABELS größten Werte beschriftet.
+    
+    Args:
+        counts: Anzahlen in der Reihenfolge der Datumswerte
+        
+    Returns:
+        list: Indizes der zu beschriftenden Datenpunkte in aufsteigender Reihenfolge
+    """
+    if len(counts) <= TIMELINE_LABEL_LIMIT:
+        return list(range(len(counts)))
+    return sorted(heapq.nlargest(TIMELINE_TOP_LABELS, range(len(counts)), key=counts.__getitem__))
+
+def _create_timeline_label(ax, app, date, count):
+    """
+    Erstellt die Wertbeschriftung für einen Datenpunkt des Zeitverlaufs.
+    
+    Args:
+        ax: Die Achse mit dem Chart
+        app: Die GuiApp-Instanz
+        date: Datum des Datenpunkts
+        count: Anzahl der Dokumente
+        
+    Returns:
+        Text: Die erstellte Beschriftung (unsichtbar bei Anzahl 0)
+    """
+    label = ax.text(date, count,
+           f'{int(count)}',
+           ha='center', va='bottom',
+           color=app.colors["text_primary"],
+           fontsize=10,
+           bbox=dict(boxstyle="round,pad=0.3", 
+                    facecolor=app.colors["background_medium"], 
+                    alpha=0.8,
+                    edgecolor='none'))
+    label.set_visible(count > 0)
+    return label
\ No newline at end of file
@@ -7,6 +7,23 @@ Dokumenttypen und Größenverteilungen.
 import logging
 from . import gui_charts_core as core
 
+# Angepasste Farbpalette für bessere Sichtbarkeit im Dark Mode (Typ-Chart)
+TYPE_COLORS = (
+    '#3498db',  # Hellblau
+    '#2ecc71',  # Grün
+    '#e74c3c',  # Rot
+    '#f39c12',  # Orange
+    '#9b59b6',  # Violett
+)
+
+# Farbpalette für die Größenkategorien (Größen-Chart)
+SIZE_COLORS = (
+    '#2ecc71',  # Grün
+    '#3498db',  # Blau
+    '#f39c12',  # Orange
+    '#e74c3c'   # Rot
+)
+
 def update_type_chart(ax, data, app, figure):
     """
     Aktualisiert ein Achsenobjekt mit einem Chart zur Visualisierung der Dokumenttypen.
@@ -18,28 +35,28 @@ def update_type_chart(ax, data, app, figure):
             core.handle_empty_data(ax, app, "Keine Dokumenttypen verfügbar")
             return
         
-        sorted_types = dict(sorted(types.items(), key=lambda item: item[1], reverse=True))
-        
-        # Angepasste Farbpalette für bessere Sichtbarkeit im Dark Mode
-        colors = [
-            '#3498db',  # Hellblau
-            '#2ecc71',  # Grün
-            '#e74c3c',  # Rot
-            '#f39c12',  # Orange
-            '#9b59b6',  # Violett
-        ]
+        # Nach Anzahl sortieren und auf die Top 10 begrenzen
+        sorted_types = core.limit_top_entries(types)
+        
+        # Bei gleicher Anzahl an Kategorien nur die bestehenden Balken anpassen;
+        # Farben hängen nur von der Position ab
+        if _has_bars(ax, "type_bars") and len(sorted_types) == len(ax.type_data):
+            _refresh_bars(ax, ax.type_bars, ax.type_labels, sorted_types.values())
+            
+            # Geänderte Reihenfolge oder Namen erfordern neue Achsenbeschriftungen
+            if list(sorted_types) != list(ax.type_data):
+                ax.set_xticklabels(list(sorted_types), rotation=45, ha='right')
+            
+            ax.type_data = sorted_types
+            return
         
-        if len(sorted_types) > 10:
-            top_types = dict(list(sorted_types.items())[:9])
-            other_count = sum(dict(list(sorted_types.items())[9:]).values())
-            top_types["Andere"] = other_count
-            sorted_types = top_types
+        ax.clear()
         
         # Balkendiagramm erstellen
         bars = ax.bar(
             sorted_types.keys(),
             sorted_types.values(),
-            color=colors[:len(sorted_types)],
+            color=TYPE_COLORS[:len(sorted_types)],
             edgecolor='none',
             alpha=0.9
         )
@@ -53,25 +70,17 @@ def update_type_chart(ax, data, app, figure):
         ax.set_xlabel("Dokumenttyp", color=app.colors["text_primary"])
         ax.set_ylabel("Anzahl", color=app.colors["text_primary"])
         
-        # X-Achsen-Beschriftungen rotieren
-        ax.set_xticklabels(sorted_types.keys(), rotation=45, ha='right')
+        # X-Achsen-Beschriftungen rotieren (Ticks vorher festlegen, sonst warnt matplotlib)
+        ax.set_xticks(range(len(sorted_types)))
+        ax.set_xticklabels(list(sorted_types), rotation=45, ha='right')
         
         # Zahlen über den Balken anzeigen
-        for bar in bars:
-            height = bar.get_height()
-            if height > 0:
-                ax.text(bar.get_x() + bar.get_width()/2., height,
-                       f'{int(height)}',
-                       ha='center', va='bottom',
-                       color=app.colors["text_primary"],
-                       fontsize=10)
+        ax.type_bars = bars
+        ax.type_labels = _create_bar_labels(ax, bars, app)
         
         # Dark Theme anwenden
         core.apply_dark_theme(ax, app, figure)
         
-        # Layout anpassen
-        figure.tight_layout()
-        
         # Daten im Chart-Objekt speichern für Interaktivität
         ax.type_data = sorted_types
         
@@ -85,34 +94,27 @@ def update_size_chart(ax, data, app, figure):
     Aktualisiert ein Achsenobjekt mit einem Chart zur Visualisierung der Dokumentgrößen.
     """
     try:
-        sizes = data.get("sizes", {})
+        # Die Datensammlung liefert alle Größenkategorien bereits in Anzeigereihenfolge
+        ordered_sizes = data.get("sizes", {})
         
-        if not sizes:
+        if not any(ordered_sizes.values()):
             core.handle_empty_data(ax, app, "Keine Größendaten verfügbar")
             return
         
-        # Größenkategorien in der richtigen Reihenfolge
-        size_order = ["<0.5 MB", "0.5-1 MB", "1-5 MB", ">5 MB"]
-        ordered_sizes = {}
-        for category in size_order:
-            if category in sizes:
-                ordered_sizes[category] = sizes[category]
-            else:
-                ordered_sizes[category] = 0
-        
-        # Angepasste Farbpalette für bessere Sichtbarkeit
-        colors = [
-            '#2ecc71',  # Grün
-            '#3498db',  # Blau
-            '#f39c12',  # Orange
-            '#e74c3c'   # Rot
-        ]
+        # Die Kategorien sind fest, daher genügt meist ein Anpassen der Balkenhöhen
+        if _has_bars(ax, "size_bars"):
+            _refresh_bars(ax, ax.size_bars, ax.size_labels, ordered_sizes.values())
+            ax.size_data = ordered_sizes
+            ax.documents = data.get("documents", [])
+            return
+        
+        ax.clear()
         
         # Balkendiagramm erstellen
         bars = ax.bar(
             ordered_sizes.keys(),
             ordered_sizes.values(),
-            color=colors[:len(ordered_sizes)],
+            color=SIZE_COLORS[:len(ordered_sizes)],
             edgecolor='none',
             alpha=0.9
         )
@@ -127,21 +129,12 @@ def update_size_chart(ax, data, app, figure):
         ax.set_ylabel("Anzahl", color=app.colors["text_primary"])
         
         # Zahlen über den Balken anzeigen
-        for bar in bars:
-            height = bar.get_height()
-            if height > 0:
-                ax.text(bar.get_x() + bar.get_width()/2., height,
-                       f'{int(height)}',
-                       ha='center', va='bottom',
-                       color=app.colors["text_primary"],
-                       fontsize=10)
+        ax.size_bars = bars
+        ax.size_labels = _create_bar_labels(ax, bars, app)
         
         # Dark Theme anwenden
         core.apply_dark_theme(ax, app, figure)
         
-        # Layout anpassen
-        figure.tight_layout()
-        
         # Daten im Chart-Objekt speichern für Interaktivität
         ax.size_data = ordered_sizes
         ax.documents = data.get("documents", [])
@@ -149,4 +142,60 @@ def update_size_chart(ax, data, app, figure):
     except Exception as e:
         logger = logging.getLogger(__name__)
         logger.error(f"Fehler beim Aktualisieren des Größen-Charts: {str(e)}")
-        core.handle_empty_data(ax, app, f"Fehler bei Größendarstellung: {type(e).__name__}")
\ No newline at end of file
+        core.handle_empty_data(ax, app, f"Fehler bei Größendarstellung: {type(e).__name__}")
+
+def _create_bar_labels(ax, bars, app):
+    """
+    Erstellt für jeden Balken eine Wertbeschriftung (bei Höhe 0 unsichtbar).
+    
+    Args:
+        ax: Die Achse mit dem Chart
+        bars: BarContainer des Balkendiagramms
+        app: Die GuiApp-Instanz
+        
+    Returns:
+        list: Die Textobjekte in der Reihenfolge der Balken
+    """
+    heights = [bar.get_height() for bar in bars]
+    labels = ax.bar_label(
+        bars,
+        labels=[f'{int(height)}' for height in heights],
+        color=app.colors["text_primary"],
+        fontsize=10
+    )
+    for label, height in zip(labels, heights):
+        label.set_visible(height > 0)
+    return labels
+
+def _has_bars(ax, attribute):
+    """
+    Prüft, ob die Achse noch das zuvor gezeichnete Balkendiagramm enthält.
+    
+    Args:
+        ax: Die Achse mit dem Chart
+        attribute: Name des Attributs mit dem gespeicherten BarContainer
+        
+    Returns:
+        bool: True, wenn die Balken noch angezeigt werden
+    """
+    bars = getattr(ax, attribute, None)
+    return bars is not None and any(container is bars for container in ax.containers)
+
+def _refresh_bars(ax, bars, labels, values):
+    """
+    Aktualisiert Höhen und Beschriftungen bestehender Balken, ohne die Achse neu aufzubauen.
+    
+    Args:
+        ax: Die Achse mit dem Chart
+        bars: BarContainer des Balkendiagramms
+        labels: Wertbeschriftungen der Balken
+        values: Neue Werte in der Reihenfolge der Balken
+    """
+    for bar, label, value in zip(bars, labels, values):
+        bar.set_height(value)
+        label.xy = (label.xy[0], value)
+        label.set_text(f'{int(value)}')
+        label.set_visible(value > 0)
+    
+    ax.relim()
+    ax.autoscale_view()
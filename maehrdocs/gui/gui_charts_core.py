@@ -9,7 +9,10 @@ import matplotlib
 matplotlib.use("TkAgg")  
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+import heapq
 import logging
+import weakref
+from operator import itemgetter
 import tkinter as tk
 from tkinter import ttk
 
@@ -30,11 +33,24 @@ matplotlib.rcParams.update({
 # Globale Variablen für interaktive Charts
 active_tooltips = {}
 
+# Bereits erstellte (Figure, Canvas) je Eltern-Frame; Einträge verschwinden mit dem Frame
+_figure_cache = weakref.WeakKeyDictionary()
+
 def create_chart_figure(app, parent_frame):
     """
     Erstellt eine neue matplotlib-Figur und Canvas für Charts mit Dark-Theme-Unterstützung.
+    
+    Existiert für das Eltern-Frame bereits eine Figur, wird diese geleert und
+    wiederverwendet, statt Figure und Canvas neu anzulegen.
     """
     try:
+        cached = _figure_cache.get(parent_frame)
+        if cached is not None and cached[1].get_tk_widget().winfo_exists():
+            figure, canvas = cached
+            figure.clf()
+            figure.patch.set_facecolor(app.colors["background_medium"])
+            return figure, canvas
+        
         figure = Figure(figsize=(5, 4), dpi=100)
         figure.patch.set_facecolor(app.colors["background_medium"])
         
@@ -42,6 +58,11 @@ def create_chart_figure(app, parent_frame):
         canvas.get_tk_widget().pack(fill="both", expand=True)
         canvas.get_tk_widget().configure(bg=app.colors["background_medium"])
         
+        # Das Canvas hält sein Frame als master fest, daher den Eintrag beim Zerstören entfernen
+        _figure_cache[parent_frame] = (figure, canvas)
+        canvas.get_tk_widget().bind(
+            "<Destroy>", lambda event: _figure_cache.pop(parent_frame, None), add="+"
+        )
         return figure, canvas
     except Exception as e:
         logger = logging.getLogger(__name__)
@@ -53,47 +74,64 @@ def create_chart_figure(app, parent_frame):
         empty_canvas.get_tk_widget().configure(bg=app.colors["background_medium"])
         return empty_figure, empty_canvas
 
+def limit_top_entries(counts, max_entries=10):
+    """
+    Sortiert Zählwerte absteigend und fasst bei mehr als max_entries Einträgen
+    alle nach den ersten max_entries - 1 unter "Andere" zusammen.
+    
+    Args:
+        counts: Dictionary {Bezeichnung: Anzahl}
+        max_entries: Maximale Anzahl angezeigter Einträge
+        
+    Returns:
+        dict: Absteigend sortierte Einträge, ggf. mit "Andere" am Ende
+    """
+    if len(counts) <= max_entries:
+        return dict(sorted(counts.items(), key=itemgetter(1), reverse=True))
+    
+    # Nur die größten Einträge sortieren, der Rest geht als Summe in "Andere" ein
+    top_entries = dict(heapq.nlargest(max_entries - 1, counts.items(), key=itemgetter(1)))
+    top_entries["Andere"] = sum(counts.values()) - sum(top_entries.values())
+    return top_entries
+
 def apply_dark_theme(ax, app, figure):
     """
     Wendet Dark-Theme-Styling auf ein Achsenobjekt an.
+    
+    Wurde das Theme mit denselben Farben bereits auf die (seitdem nicht geleerte)
+    Achse angewendet, bleibt sie unverändert.
     """
     try:
         bg_color = app.colors["background_medium"]
         text_color = app.colors["text_primary"]
+        grid_color = app.colors["text_secondary"]
+        
+        # ax.clear() erzeugt einen neuen Titel; daran wird eine geleerte Achse erkannt
+        theme_key = (bg_color, text_color, grid_color)
+        applied = getattr(ax, "dark_theme", None)
+        if applied is not None and applied[0] == theme_key and applied[1] is ax.title:
+            return
         
         ax.set_facecolor(bg_color)
         ax.title.set_color(text_color)
         ax.xaxis.label.set_color(text_color)
         ax.yaxis.label.set_color(text_color)
         
-        for tick in ax.get_xticklabels():
-            tick.set_color(text_color)
-        for tick in ax.get_yticklabels():
-            tick.set_color(text_color)
+        # Ticks, Tick-Beschriftungen und Gitterlinien in einem Aufruf (gilt auch für neue Ticks)
+        ax.tick_params(axis='both', colors=text_color, grid_color=grid_color, grid_alpha=0.1)
         
         for spine in ax.spines.values():
-            spine.set_edgecolor(app.colors["text_secondary"])
+            spine.set_edgecolor(grid_color)
             spine.set_alpha(0.3)
         
-        ax.tick_params(axis='x', colors=text_color)
-        ax.tick_params(axis='y', colors=text_color)
-        
-        if ax.get_xgridlines():
-            for line in ax.get_xgridlines():
-                line.set_color(app.colors["text_secondary"])
-                line.set_alpha(0.1)
-        
-        if ax.get_ygridlines():
-            for line in ax.get_ygridlines():
-                line.set_color(app.colors["text_secondary"])
-                line.set_alpha(0.1)
-        
         legend = ax.get_legend()
         if legend:
             legend.get_frame().set_facecolor(bg_color)
             legend.get_frame().set_alpha(0.8)
             for text in legend.get_texts():
                 text.set_color(text_color)
+        
+        ax.dark_theme = (theme_key, ax.title)
     except Exception as e:
         logger = logging.getLogger(__name__)
         logger.warning(f"Fehler beim Anwenden des Dark-Themes: {str(e)}")
@@ -101,12 +139,18 @@ def apply_dark_theme(ax, app, figure):
 def handle_empty_data(ax, app, message="Keine Daten verfügbar"):
     """
     Zeigt eine Nachricht an, wenn keine Daten für ein Chart verfügbar sind.
+    
+    Zeigt die Achse bereits dieselbe Nachricht, bleibt sie unverändert.
     """
     try:
+        shown = getattr(ax, "empty_message", None)
+        if shown is not None and shown[0] == message and any(text is shown[1] for text in ax.texts):
+            return
+        
         ax.clear()
         ax.set_axis_off()
         
-        ax.text(0.5, 0.5, message, 
+        label = ax.text(0.5, 0.5, message, 
                horizontalalignment='center',
                verticalalignment='center',
                fontsize=12,
@@ -116,6 +160,7 @@ def handle_empty_data(ax, app, message="Keine Daten verfügbar"):
                          ec=app.colors["text_secondary"],
                          alpha=0.7),
                transform=ax.transAxes)
+        ax.empty_message = (message, label)
     except Exception as e:
         logger = logging.getLogger(__name__)
         logger.error(f"Fehler beim Anzeigen der 'Keine Daten'-Nachricht: {str(e)}")
@@ -29,10 +29,17 @@ from .gui_charts_advanced import (
     update_timeline_chart
 )
 from .gui_charts_interactive import register_chart_events
+from . import gui_charts_core, gui_charts_basic, gui_charts_advanced
 
 # Logger für Chart-Operationen
 logger = logging.getLogger(__name__)
 
+# Verzögerung in Millisekunden, mit der kurz aufeinanderfolgende Neuzeichnungen zusammengefasst werden
+REDRAW_DELAY_MS = 50
+
+# Chart-Typen, deren Balken bei Aktualisierungen wiederverwendet werden können
+INCREMENTAL_CHART_TYPES = {'type', 'size'}
+
 class ChartManager:
     """
     Verwaltet die Charts und ihre Aktualisierung.
@@ -51,6 +58,8 @@ class ChartManager:
         self.app = app
         self.charts = {}  # {chart_name: (figure, canvas, axis)}
         self.event_ids = {}  # {chart_name: event_id}
+        self._pending_redraws = {}  # {id(canvas): (figure, canvas)} während update_all_charts
+        self._scheduled_redraws = {}  # {id(canvas): after_id}
         self.logger = logger
         
     def create_chart(self, parent_frame, chart_name, chart_type):
@@ -87,13 +96,50 @@ class ChartManager:
             empty_canvas.get_tk_widget().pack(fill="both", expand=True)
             return empty_figure, empty_canvas
     
-    def update_chart(self, chart_name, data):
+    def create_chart_grid(self, parent_frame, chart_specs, columns=2):
+        """
+        Erstellt mehrere Charts als Achsen einer gemeinsamen Figur.
+        
+        Alle Charts teilen sich ein Canvas, sodass eine Aktualisierung nur ein
+        Layout und ein Neuzeichnen auslöst.
+        
+        Args:
+            parent_frame: Das übergeordnete Frame
+            chart_specs: Liste von (chart_name, chart_type) in Anzeigereihenfolge
+            columns: Anzahl der Spalten im Raster
+            
+        Returns:
+            tuple: (Figure, Canvas) für manuelle Anpassungen
+        """
+        try:
+            figure, canvas = create_chart_figure(self.app, parent_frame)
+            rows = (len(chart_specs) + columns - 1) // columns
+            
+            for index, (chart_name, chart_type) in enumerate(chart_specs):
+                ax = figure.add_subplot(rows, columns, index + 1)
+                
+                # Chart registrieren; Klicks werden über event.inaxes der Achse zugeordnet
+                self.charts[chart_name] = (figure, canvas, ax, chart_type)
+                self.event_ids[chart_name] = register_chart_events(figure, canvas, ax, self.app, chart_type)
+            
+            return figure, canvas
+            
+        except Exception as e:
+            self.logger.error(f"Fehler beim Erstellen des Chart-Rasters: {str(e)}")
+            # Leeres Figure und Canvas erstellen als Fallback
+            empty_figure = Figure(figsize=(5, 4), dpi=100)
+            empty_canvas = FigureCanvasTkAgg(empty_figure, master=parent_frame)
+            empty_canvas.get_tk_widget().pack(fill="both", expand=True)
+            return empty_figure, empty_canvas
+    
+    def update_chart(self, chart_name, data, draw=True):
         """
         Aktualisiert ein Chart mit neuen Daten.
         
         Args:
             chart_name: Name des zu aktualisierenden Charts
             data: Die neuen Daten für das Chart
+            draw: Bei False wird das Neuzeichnen nur vorgemerkt (für update_all_charts)
             
         Returns:
             bool: True bei Erfolg, False bei Fehler
@@ -105,8 +151,10 @@ class ChartManager:
                 
             figure, canvas, ax, chart_type = self.charts[chart_name]
             
-            # Chart leeren
-            ax.clear()
+            # Chart leeren; Typ- und Größen-Chart entscheiden selbst, ob sie
+            # bestehende Balken anpassen können oder neu zeichnen müssen
+            if chart_type not in INCREMENTAL_CHART_TYPES:
+                ax.clear()
             
             # Je nach Chart-Typ aktualisieren
             if chart_type == 'type':
@@ -122,8 +170,11 @@ class ChartManager:
                 handle_empty_data(ax, self.app, f"Unbekannter Chart-Typ: {chart_type}")
                 return False
             
-            # Canvas aktualisieren
-            canvas.draw()
+            # Neuzeichnen anstoßen bzw. für das gemeinsame Neuzeichnen vormerken
+            if draw:
+                self._redraw(figure, canvas)
+            else:
+                self._pending_redraws[id(canvas)] = (figure, canvas)
             return True
             
         except Exception as e:
@@ -134,7 +185,7 @@ class ChartManager:
                 figure, canvas, ax, _ = self.charts[chart_name]
                 ax.clear()
                 handle_empty_data(ax, self.app, f"Fehler: {str(e)}")
-                canvas.draw()
+                canvas.draw_idle()
                 
             return False
     
@@ -185,10 +236,52 @@ class ChartManager:
             int: Anzahl der erfolgreich aktualisierten Charts
         """
         success_count = 0
+        self._pending_redraws = {}
         for chart_name in self.charts:
-            if self.update_chart(chart_name, data):
+            if self.update_chart(chart_name, data, draw=False):
                 success_count += 1
+        
+        # Jede Figur nur einmal layouten und zeichnen, auch wenn sich mehrere Charts sie teilen
+        for figure, canvas in self._pending_redraws.values():
+            self._redraw(figure, canvas)
+        self._pending_redraws = {}
+        
         return success_count
+    
+    def _redraw(self, figure, canvas):
+        """
+        Plant das Neuzeichnen einer Figur nach REDRAW_DELAY_MS ein.
+        
+        Weitere Anforderungen für dasselbe Canvas innerhalb der Verzögerung
+        ersetzen die geplante, sodass schnelle Folgen von Aktualisierungen nur
+        einmal gezeichnet werden.
+        
+        Args:
+            figure: Die neu zu zeichnende Figur
+            canvas: Das zugehörige Canvas
+        """
+        widget = canvas.get_tk_widget()
+        
+        scheduled = self._scheduled_redraws.pop(id(canvas), None)
+        if scheduled is not None:
+            widget.after_cancel(scheduled)
+        
+        self._scheduled_redraws[id(canvas)] = widget.after(REDRAW_DELAY_MS, self._draw_figure, figure, canvas)
+    
+    def _draw_figure(self, figure, canvas):
+        """
+        Passt das Layout an und stößt das Neuzeichnen im Leerlauf an.
+        
+        Args:
+            figure: Die neu zu zeichnende Figur
+            canvas: Das zugehörige Canvas
+        """
+        self._scheduled_redraws.pop(id(canvas), None)
+        if not canvas.get_tk_widget().winfo_exists():
+            return
+        
+        figure.tight_layout()
+        canvas.draw_idle()
 
 # Integrationsklasse für die bestehende StatisticsPanel-Klasse
 class StatisticsPanelManager:
@@ -247,7 +340,7 @@ def create_chart_figure(app, parent_frame):
     Returns:
         tuple: (Figure, Canvas)
     """
-    return create_chart_figure(app, parent_frame)
+    return gui_charts_core.create_chart_figure(app, parent_frame)
 
 def update_type_chart(ax, data, app, figure):
     """
@@ -259,7 +352,7 @@ def update_type_chart(ax, data, app, figure):
         app: Die GuiApp-Instanz
         figure: Die Figure
     """
-    update_type_chart(ax, data, app, figure)
+    gui_charts_basic.update_type_chart(ax, data, app, figure)
 
 def update_sender_chart(ax, data, app, figure):
     """
@@ -271,7 +364,7 @@ def update_sender_chart(ax, data, app, figure):
         app: Die GuiApp-Instanz
         figure: Die Figure
     """
-    update_sender_chart(ax, data, app, figure)
+    gui_charts_advanced.update_sender_chart(ax, data, app, figure)
 
 def update_size_chart(ax, data, app, figure):
     """
@@ -283,7 +376,7 @@ def update_size_chart(ax, data, app, figure):
         app: Die GuiApp-Instanz
         figure: Die Figure
     """
-    update_size_chart(ax, data, app, figure)
+    gui_charts_basic.update_size_chart(ax, data, app, figure)
 
 def update_timeline_chart(ax, data, app, figure):
     """
@@ -295,4 +388,4 @@ def update_timeline_chart(ax, data, app, figure):
         app: Die GuiApp-Instanz
         figure: Die Figure
     """
-    update_timeline_chart(ax, data, app, figure)
\ No newline at end of file
+    gui_charts_advanced.update_timeline_chart(ax, data, app, figure)
\ No newline at end of file
@@ -8,6 +8,8 @@ import threading
 from tkinter import messagebox
 from datetime import datetime
 
+from .gui_notification_handlers import DUPLICATE_JSON_PREFIX, parse_duplicate_line
+
 def run_command_in_thread(app, command, env=None):
     """
     Führt einen Befehl in einem separaten Thread aus
@@ -20,8 +22,9 @@ def run_command_in_thread(app, command, env=None):
     # Status aktualisieren
     app.status_label.config(text="Verarbeitung läuft...")
     
-    # Log protokollieren
-    app.log(f"Führe Befehl aus: {' '.join(command)}")
+    # Log protokollieren (Befehlszeile nur zusammensetzen, wenn sie ausgegeben wird)
+    if app.log_enabled("info"):
+        app.log("Führe Befehl aus: %s", ' '.join(command))
     
     # Thread starten
     thread = threading.Thread(target=_run_command, args=(app, command, env))
@@ -53,17 +56,15 @@ def _run_command(app, command, env=None):
         for line in process.stdout:
             line = line.strip()
             
-            # Auf spezielle Duplikatmarkierung prüfen
-            if "DUPLIKAT_ERKANNT|" in line:
+            # Auf spezielle Duplikatmarkierung prüfen (JSON-Meldung oder älteres Format)
+            if line.startswith(DUPLICATE_JSON_PREFIX) or "DUPLIKAT_ERKANNT|" in line:
                 # Duplikatinformationen extrahieren
-                parts = line.split("|")
-                if len(parts) >= 4:
-                    original_file = parts[1]
-                    duplicate_file = parts[2]
-                    similarity = parts[3]
+                duplicate_info = parse_duplicate_line(line)
+                if duplicate_info:
+                    original_file, duplicate_file, similarity = duplicate_info
                     
                     # Blau formatierte Duplikatmeldung
-                    duplikat_message = f"Duplikat erkannt: {duplicate_file} ist identisch mit {original_file} (Ähnlichkeit: {similarity})"
+                    duplikat_message = f"Duplikat erkannt: {duplicate_file} ist identisch mit {original_file} (Ähnlichkeit: {similarity:.2f})"
                     
                     # In das Log schreiben
                     app.log(duplikat_message, level="duplicate")
@@ -10,6 +10,7 @@ und der Anwendungskonfiguration.
 import tkinter as tk
 import logging
 from tkinter import messagebox
+from types import SimpleNamespace
 
 # Prüfe, ob TkinterDnD2 installiert ist für Drag & Drop Funktionalität
 DRAG_DROP_ENABLED = False
@@ -28,7 +29,7 @@ from .gui_layout import (
     create_log_panel,
     create_status_bar
 )
-from .gui_logger import setup_logging, log_message
+from .gui_logger import setup_logging, log_message, LOG_LEVELS
 from .gui_utils import (
     update_dashboard,
     check_for_new_documents,
@@ -38,10 +39,30 @@ from .gui_utils import (
 from .gui_settings import open_settings
 from .gui_help import show_help
 from .gui_actions import handle_drop
+from .gui_drop_handlers import create_copy_progress_dialog
 
 # Neuer Import für den ErrorHandler
 from maehrdocs.error_handler import ErrorHandler
 
+class StyleTable(SimpleNamespace):
+    """
+    Unveränderliche Tabelle für Farben und Schriftarten.
+    
+    Werte werden wie bei einem Dict gelesen (app.colors["primary"], "primary" in
+    app.colors, app.colors.get("primary")).
+    """
+    def __setattr__(self, name, value):
+        raise AttributeError(f"StyleTable ist unveränderlich: {name}")
+    
+    def __getitem__(self, key):
+        return self.__dict__[key]
+    
+    def __contains__(self, key):
+        return key in self.__dict__
+    
+    def get(self, key, default=None):
+        return self.__dict__.get(key, default)
+
 class GuiApp:
     """
     Hauptklasse für die MaehrDocs GUI-Anwendung.
@@ -77,27 +98,27 @@ class GuiApp:
         self.error_handler = ErrorHandler(self)
         
         # Farbschema definieren - modernes, dunkles Design
-        self.colors = {
-            "background_dark": "#0D1117",    # Tiefdunkles Blau-Schwarz
-            "background_medium": "#161B22",  # Etwas hellerer Hintergrund
-            "card_background": "#1F2937",    # Dunkles Grau-Blau für Panels
-            "primary": "#3B82F6",            # Auffälliges, modernes Blau
-            "accent": "#60A5FA",             # Helleres Blau für Hover
-            "text_primary": "#F9FAFB",       # Fast weiß
-            "text_secondary": "#9CA3AF",     # Mittelhelles Grau-Blau
-            "success": "#10B981",            # Frisches Grün
-            "warning": "#FBBF24",            # Sattes Gelb-Orange
-            "error": "#EF4444"               # Kräftiges Rot
-        }
+        self.colors = StyleTable(
+            background_dark="#0D1117",    # Tiefdunkles Blau-Schwarz
+            background_medium="#161B22",  # Etwas hellerer Hintergrund
+            card_background="#1F2937",    # Dunkles Grau-Blau für Panels
+            primary="#3B82F6",            # Auffälliges, modernes Blau
+            accent="#60A5FA",             # Helleres Blau für Hover
+            text_primary="#F9FAFB",       # Fast weiß
+            text_secondary="#9CA3AF",     # Mittelhelles Grau-Blau
+            success="#10B981",            # Frisches Grün
+            warning="#FBBF24",            # Sattes Gelb-Orange
+            error="#EF4444"               # Kräftiges Rot
+        )
         
         # Schriftarten definieren
-        self.fonts = {
-            "header": ("Segoe UI", 16, "bold"),
-            "subheader": ("Segoe UI", 14, "bold"),
-            "normal": ("Segoe UI", 12),
-            "small": ("Segoe UI", 10),
-            "code": ("Consolas", 11)
-        }
+        self.fonts = StyleTable(
+            header=("Segoe UI", 16, "bold"),
+            subheader=("Segoe UI", 14, "bold"),
+            normal=("Segoe UI", 12),
+            small=("Segoe UI", 10),
+            code=("Consolas", 11)
+        )
         
         # GUI-Elemente
         self.root = None
@@ -112,6 +133,24 @@ class GuiApp:
         
         # Zentrale Messaging-Instanz (wird in setup_gui initialisiert)
         self.messaging = None
+        
+        # Wiederverwendbares Fortschrittsfenster für Kopiervorgänge (wird in setup_gui erstellt)
+        self._copy_progress = None
+        
+        # Verborgene Benachrichtigungsfenster zur Wiederverwendung
+        self._notif_pool = []
+        
+        # Eingabefelder des geöffneten Einstellungsfensters (werden beim Erstellen registriert)
+        self._settings_fields = []
+        
+        # Eingabefelder nach Konfigurationsschlüssel für direkten Zugriff
+        self._field_index = {}
+        
+        # Verborgenes Einstellungsfenster zur Wiederverwendung
+        self._cached_settings_window = None
+        
+        # ttk-Stile für Formulare werden beim ersten Formular angelegt
+        self._form_styles_configured = False
     
     def setup_gui(self):
         """
@@ -186,6 +225,9 @@ class GuiApp:
             # Dashboard aktualisieren
             update_dashboard(self)
             
+            # Fortschrittsfenster für Kopiervorgänge einmalig vorbereiten
+            self._copy_progress = create_copy_progress_dialog(self)
+            
             # Drag & Drop-Unterstützung hinzufügen (wenn verfügbar)
             if DRAG_DROP_ENABLED:
                 setup_drag_drop(self, lambda e: handle_drop(self, e))
@@ -233,20 +275,58 @@ class GuiApp:
         
         self.error_handler.try_except(_browse_folder, context="Ordnerdialog", level="warning")
     
-    def log(self, message, level="info"):
+    def _has_log_target(self):
+        """
+        Prüft, ob Messaging-System oder Protokollbereich verfügbar sind.
+        
+        Returns:
+            bool: True, wenn Nachrichten angezeigt werden können
+        """
+        return bool(getattr(self, 'messaging', None) or getattr(self, 'log_text', None))
+    
+    def log_enabled(self, level="info"):
+        """
+        Prüft, ob sich teure Nachrichtenaufbereitung für ein Level lohnt.
+        
+        Liefert False, wenn weder Messaging-System noch Protokollbereich
+        verfügbar sind oder der Logger das Level nicht ausgibt. Die Ausgabe
+        von log() selbst hängt nicht vom Level des Loggers ab.
+        
+        Args:
+            level: Log-Level (info, warning, error, success)
+            
+        Returns:
+            bool: True, wenn die Aufbereitung erfolgen soll
+        """
+        if not self._has_log_target():
+            return False
+        
+        log_level = LOG_LEVELS.get(level, LOG_LEVELS["info"])[2]
+        return self.logger.isEnabledFor(log_level)
+    
+    def log(self, message, *args, level="info"):
         """
         Fügt eine Nachricht zum Protokollbereich hinzu.
         
         Zentrale Methode zur Protokollierung von Nachrichten in der GUI
         mit entsprechender visueller Hervorhebung je nach Log-Level.
+        Zusätzliche Argumente werden wie beim logging-Modul erst dann per
+        %-Formatierung eingesetzt, wenn die Nachricht tatsächlich ausgegeben wird.
         
         Args:
-            message: Die zu protokollierende Nachricht
+            message: Die zu protokollierende Nachricht (ggf. mit %s-Platzhaltern)
+            *args: Werte für die Platzhalter in message
             level: Log-Level (info, warning, error, success)
         """
+        if not self._has_log_target():
+            return
+        
+        if args:
+            message = message % args
+        
         # Bei verfügbarem Messaging-System dieses verwenden
         if hasattr(self, 'messaging') and self.messaging:
             self.messaging.notify(message, level=level)
         else:
             # Fallback zur älteren Methode
-            log_message(self, message, level)
\ No newline at end of file
+            log_message(self, message, level)
@@ -65,16 +65,20 @@ def create_dashboard(app, parent, config, open_folder_callback):
     )
     activity_header.pack(anchor=tk.W, pady=(0, 10))
     
-    activity_list = tk.Text(
+    # Einzeiliges Label statt Textfeld: die Anzeige wird per configure(text=...) ersetzt
+    activity_list = tk.Label(
         activity_frame, 
         height=3, 
         bg=app.colors["background_medium"],
         fg=app.colors["text_primary"],
         font=app.fonts["normal"],
-        wrap=tk.WORD,
-        state=tk.DISABLED
+        anchor=tk.NW,
+        justify=tk.LEFT
     )
     activity_list.pack(fill=tk.X)
+    
+    # Zeilenumbruch an die aktuelle Breite anpassen
+    activity_list.bind("<Configure>", lambda e: activity_list.config(wraplength=e.width))
     dashboard_elements["activity_list"] = activity_list
     
     # NEU: Statistik-Panel hinzufügen
@@ -84,5 +88,6 @@ def create_dashboard(app, parent, config, open_folder_callback):
     # Statistik-Panel erstellen
     stats_elements = create_statistics_panel(app, statistics_frame)
     dashboard_elements["statistics_panel"] = stats_elements["stats_frame"]
+    dashboard_elements["stats_panel"] = stats_elements.get("stats_panel")
     
     return dashboard_elements
\ No newline at end of file
@@ -8,6 +8,7 @@ import time
 import shutil
 import threading
 import tkinter as tk
+from pathlib import Path
 
 def handle_drop(app, event):
     """
@@ -57,24 +58,29 @@ def handle_drop(app, event):
         ):
             copy_files_to_inbox(app, pdf_files)
 
-def copy_files_to_inbox(app, file_list):
+def create_copy_progress_dialog(app):
     """
-    Kopiert Dateien in den Eingangsordner
+    Erstellt das Fortschrittsfenster für Kopiervorgänge einmalig und verbirgt es
+    
+    Das Fenster wird bei jedem Kopiervorgang wiederverwendet, statt es jedes Mal
+    neu zu erstellen und danach zu zerstören.
     
     Args:
         app: Instanz der GuiApp
-        file_list: Liste der zu kopierenden Dateipfade
+        
+    Returns:
+        dict: Referenzen auf Fenster, Beschreibung, Fortschrittsbalken und Dateilabel
     """
     from tkinter import ttk
     
-    inbox_dir = app.config["paths"]["input_dir"]
-    
     # Fortschrittsfenster erstellen
     progress_window = tk.Toplevel(app.root)
     progress_window.title("Dateien werden kopiert...")
     progress_window.geometry("400x200")
     progress_window.configure(bg=app.colors["background_dark"])
-    progress_window.grab_set()  # Modal machen
+    
+    # Schließen blendet das Fenster nur aus
+    progress_window.protocol("WM_DELETE_WINDOW", progress_window.withdraw)
     
     progress_frame = tk.Frame(
         progress_window, 
@@ -87,7 +93,7 @@ def copy_files_to_inbox(app, file_list):
     # Beschreibung
     label = tk.Label(
         progress_frame, 
-        text=f"Kopiere {len(file_list)} Dateien in den Eingangsordner...", 
+        text="", 
         font=app.fonts["normal"],
         fg=app.colors["text_primary"],
         bg=app.colors["background_medium"]
@@ -108,28 +114,67 @@ def copy_files_to_inbox(app, file_list):
     )
     file_label.pack(pady=5)
     
+    # Bis zur ersten Verwendung verbergen
+    progress_window.withdraw()
+    
+    return {
+        "window": progress_window,
+        "label": label,
+        "bar": progress,
+        "file_label": file_label
+    }
+
+def copy_files_to_inbox(app, file_list):
+    """
+    Kopiert Dateien in den Eingangsordner
+    
+    Args:
+        app: Instanz der GuiApp
+        file_list: Liste der zu kopierenden Dateipfade
+    """
+    inbox_dir = app.config["paths"]["input_dir"]
+    
+    # Vorhandenes Fortschrittsfenster wiederverwenden (Fallback: einmalig erstellen)
+    dlg = getattr(app, '_copy_progress', None)
+    if dlg is None or not dlg["window"].winfo_exists():
+        dlg = app._copy_progress = create_copy_progress_dialog(app)
+    
+    progress_window = dlg["window"]
+    progress = dlg["bar"]
+    file_label = dlg["file_label"]
+    
+    # Zustand zurücksetzen und anzeigen
+    dlg["label"].config(text=f"Kopiere {len(file_list)} Dateien in den Eingangsordner...")
+    progress['value'] = 0
+    file_label.config(text="")
+    progress_window.deiconify()
+    progress_window.grab_set()  # Modal machen
+    
     # In einem Thread kopieren
     def copy_thread():
         success_count = 0
         error_count = 0
         
+        # Zielordner einmalig als Pfadobjekt aufbereiten
+        inbox = Path(inbox_dir)
+        total = len(file_list)
+        
         for i, file_path in enumerate(file_list):
+            file_name = Path(file_path).name
             try:
                 # UI aktualisieren
-                progress['value'] = (i / len(file_list)) * 100
-                file_name = os.path.basename(file_path)
+                progress['value'] = (i / total) * 100
                 file_label.config(text=f"Kopiere: {file_name}")
                 
                 # Datei kopieren
-                dest_path = os.path.join(inbox_dir, file_name)
-                shutil.copy2(file_path, dest_path)
+                shutil.copy2(file_path, inbox / file_name)
                 
                 # Log
                 app.messaging.notify(f"Datei kopiert: {file_name}")
                 success_count += 1
                 
             except Exception as e:
-                app.messaging.notify(f"Fehler beim Kopieren von {os.path.basename(file_path)}: {str(e)}", level="error")
+                app.messaging.notify(f"Fehler beim Kopieren von {file_name}: {str(e)}", level="error")
                 error_count += 1
                 
             # Kurze Pause für die UI
@@ -153,8 +198,9 @@ def copy_files_to_inbox(app, file_list):
                 type="warning"
             )
         
-        # Fenster schließen
-        progress_window.destroy()
+        # Fenster ausblenden (wird beim nächsten Kopiervorgang wiederverwendet)
+        progress_window.grab_release()
+        progress_window.withdraw()
         
         # Dashboard aktualisieren
         app.update_dashboard()
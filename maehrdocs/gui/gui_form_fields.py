@@ -5,7 +5,7 @@ Enthält die verschiedenen Formularfelder und deren Erstellung
 """
 
 import tkinter as tk
-from tkinter import ttk
+from tkinter import ttk, filedialog
 from .gui_buttons import create_button
 
 def create_text_field(app, parent, value=""):
@@ -37,40 +37,54 @@ def create_folder_field(app, parent, key, value=""):
     """
     Erstellt ein Feld für die Ordnerauswahl mit Durchsuchen-Button
     
+    Textfeld und Button werden direkt im Parent-Widget erstellt; die Platzierung
+    übernimmt der Aufrufer. Der Button ist über das Attribut browse_button erreichbar.
+    
     Args:
         app: Instanz der GuiApp
         parent: Parent-Widget
-        key: Konfigurationsschlüssel
+        key: Konfigurationsschlüssel (wird für den Button nicht mehr benötigt)
         value: Vorausgefüllter Wert (optional)
         
     Returns:
         tk.Entry: Das erstellte Textfeld
     """
-    input_frame = tk.Frame(parent, bg=app.colors["card_background"])
-    input_frame.pack(side=tk.LEFT, fill=tk.X, expand=True)
-    
     input_field = tk.Entry(
-        input_frame, 
+        parent, 
         font=app.fonts["normal"],
         bg=app.colors["background_medium"],
         fg=app.colors["text_primary"],
         insertbackground=app.colors["text_primary"]
     )
-    input_field.pack(side=tk.LEFT, fill=tk.X, expand=True)
     
     if isinstance(value, str):
         input_field.insert(0, value)
     
-    browse_btn = create_button(
+    input_field.browse_button = create_button(
         app,
-        input_frame, 
+        parent, 
         "...", 
-        lambda: app.browse_folder(key)
+        lambda: browse_into_field(app, input_field)
     )
-    browse_btn.pack(side=tk.LEFT, padx=5)
     
     return input_field
 
+def browse_into_field(app, entry):
+    """
+    Öffnet einen Dialog zur Ordnerauswahl und schreibt das Ergebnis direkt in das Feld
+    
+    Args:
+        app: Instanz der GuiApp
+        entry: Textfeld, das den Ordnerpfad aufnimmt
+    """
+    def _browse_folder():
+        folder = filedialog.askdirectory(title="Ordner auswählen")
+        if folder:
+            entry.delete(0, tk.END)
+            entry.insert(0, folder)
+    
+    app.error_handler.try_except(_browse_folder, context="Ordnerdialog", level="warning")
+
 def create_dropdown_field(app, parent, options, value=None):
     """
     Erstellt ein Dropdown-Feld
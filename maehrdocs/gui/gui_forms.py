@@ -5,6 +5,7 @@ Koordiniert die verschiedenen Formularelemente und -funktionen
 """
 
 import tkinter as tk
+from tkinter import ttk
 from .gui_form_fields import (
     create_text_field,
     create_folder_field,
@@ -14,78 +15,132 @@ from .gui_form_fields import (
     create_checkbox_field
 )
 
-def create_form_field(app, parent, field_config):
+def configure_form_styles(app):
+    """
+    Legt die gemeinsamen ttk-Stile für Formulare einmalig an
+    
+    Labels und Rahmen verweisen anschließend nur noch auf einen Stilnamen,
+    statt Schriftart und Farben bei jedem Widget erneut zu übergeben.
+    
+    Args:
+        app: Instanz der GuiApp
+    """
+    if app._form_styles_configured:
+        return
+    
+    colors = app.colors
+    fonts = app.fonts
+    style = ttk.Style(app.root)
+    
+    style.configure(
+        "Settings.Header.TLabel",
+        font=fonts["header"],
+        foreground=colors["text_primary"],
+        background=colors["background_medium"]
+    )
+    style.configure(
+        "Settings.Subheader.TLabel",
+        font=fonts["subheader"],
+        foreground=colors["text_primary"],
+        background=colors["card_background"]
+    )
+    style.configure(
+        "Settings.Field.TLabel",
+        font=fonts["normal"],
+        foreground=colors["text_primary"],
+        background=colors["card_background"]
+    )
+    style.configure("Settings.Card.TFrame", background=colors["card_background"])
+    
+    app._form_styles_configured = True
+
+def create_form_field(app, parent, field_config, row):
     """
     Erstellt ein einzelnes Formularfeld basierend auf der Konfiguration
     
+    Label und Eingabefeld werden ohne zusätzlichen Rahmen direkt im Grid des
+    Parent-Widgets platziert (Spalte 0: Label, Spalte 1-2: Eingabe).
+    
     Args:
         app: Instanz der GuiApp
-        parent: Parent-Widget
+        parent: Parent-Widget (mit grid-Layout)
         field_config: Feldkonfiguration (dict)
+        row: Zeile im Grid des Parent-Widgets
         
     Returns:
-        tk.Frame: Das Rahmen-Widget mit dem Feld
+        tk.Widget: Das erstellte Eingabefeld oder None
     """
-    field_frame = tk.Frame(parent, bg=app.colors["card_background"])
-    
     # Label erstellen
-    label = tk.Label(
-        field_frame, 
+    configure_form_styles(app)
+    label = ttk.Label(
+        parent, 
         text=field_config["label"] + ":", 
-        font=app.fonts["normal"],
         width=25,
         anchor=tk.W,
-        fg=app.colors["text_primary"],
-        bg=app.colors["card_background"]
+        style="Settings.Field.TLabel"
     )
-    label.pack(side=tk.LEFT)
+    label.grid(row=row, column=0, sticky=tk.W, pady=5)
+    
+    # Schlüssel als Punktpfad und als zerlegtes Tupel bereitstellen
+    key = field_config["key"]
+    if isinstance(key, tuple):
+        key_parts = key
+        key = ".".join(key)
+    else:
+        key_parts = tuple(key.split("."))
     
     # Wert aus Konfiguration holen
-    value = _get_config_value(app, field_config["key"])
+    value = _get_config_value(app, key_parts)
     
     # Feld erstellen basierend auf dem Typ
     field_type = field_config["type"]
     input_field = None
     
     if field_type == "text":
-        input_field = create_text_field(app, field_frame, value)
-        input_field.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        input_field = create_text_field(app, parent, value)
+        input_field.grid(row=row, column=1, columnspan=2, sticky=tk.EW, pady=5)
         
     elif field_type == "folder":
-        input_field = create_folder_field(app, field_frame, field_config["key"], value)
+        input_field = create_folder_field(app, parent, key, value)
+        input_field.grid(row=row, column=1, sticky=tk.EW, pady=5)
+        input_field.browse_button.grid(row=row, column=2, padx=5, pady=5)
         
     elif field_type == "dropdown":
-        input_field = create_dropdown_field(app, field_frame, field_config["options"], value)
-        input_field.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        input_field = create_dropdown_field(app, parent, field_config["options"], value)
+        input_field.grid(row=row, column=1, columnspan=2, sticky=tk.EW, pady=5)
         
     elif field_type == "spinbox":
         input_field = create_spinbox_field(
-            app, field_frame, field_config["from"], field_config["to"], value
+            app, parent, field_config["from"], field_config["to"], value
         )
-        input_field.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        input_field.grid(row=row, column=1, columnspan=2, sticky=tk.EW, pady=5)
         
     elif field_type == "scale":
         input_field = create_scale_field(
-            app, field_frame, 
+            app, parent, 
             field_config["from"], field_config["to"], field_config["resolution"], 
             value
         )
-        input_field.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        input_field.grid(row=row, column=1, columnspan=2, sticky=tk.EW, pady=5)
         
     elif field_type == "checkbox":
-        input_field = create_checkbox_field(app, field_frame, bool(value))
-        input_field.pack(side=tk.LEFT)
+        input_field = create_checkbox_field(app, parent, bool(value))
+        input_field.grid(row=row, column=1, columnspan=2, sticky=tk.W, pady=5)
     
     # Speichere Feldtyp und -schlüssel für späteren Zugriff
     if input_field:
         input_field.field_type = field_type
-        input_field.field_key = field_config["key"]
+        input_field.field_key = key
+        input_field._key_parts = key_parts
         
         # Speichere Feld im übergeordneten Frame
-        field_id = field_config["key"].replace(".", "_")
+        field_id = "_".join(key_parts)
         setattr(parent, field_id, input_field)
+        
+        # Feld über seinen Schlüssel auffindbar machen
+        app._field_index[key] = input_field
     
-    return field_frame
+    return input_field
 
 def _get_config_value(app, key_path):
     """
@@ -93,12 +148,12 @@ def _get_config_value(app, key_path):
     
     Args:
         app: Instanz der GuiApp
-        key_path: Pfad zum Konfigurationsschlüssel (mit Punkten getrennt)
+        key_path: Pfad zum Konfigurationsschlüssel (mit Punkten getrennt oder als Tupel)
         
     Returns:
         Der Wert aus der Konfiguration oder None
     """
-    keys = key_path.split(".")
+    keys = key_path if isinstance(key_path, tuple) else key_path.split(".")
     value = app.config
     
     for key in keys:
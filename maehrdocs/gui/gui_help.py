@@ -3,8 +3,7 @@ Hilfefunktionen für MaehrDocs
 Enthält Funktionen für die Anzeige von Hilfetexten und -informationen
 """
 
-import tkinter as tk
-from tkinter import scrolledtext
+from functools import lru_cache, partial
 
 from .gui_buttons import create_button
 
@@ -12,9 +11,23 @@ def show_help(app):
     """
     Zeigt ein Hilfefenster an
     
+    Das Fenster wird nur beim ersten Aufruf erstellt und danach
+    wiederverwendet (Schließen blendet es lediglich aus).
+    
     Args:
         app: Instanz der GuiApp
     """
+    # Bereits erstelltes Fenster wieder anzeigen
+    help_window = getattr(app, '_help_window', None)
+    if help_window is not None and help_window.winfo_exists():
+        help_window.deiconify()
+        help_window.lift()
+        return help_window
+    
+    # Tk-Module erst beim ersten Öffnen der Hilfe laden
+    import tkinter as tk
+    from tkinter import scrolledtext
+    
     help_window = tk.Toplevel(app.root)
     help_window.title("MaehrDocs - Hilfe")
     help_window.geometry("800x600")
@@ -42,12 +55,8 @@ def show_help(app):
     tab_frame = tk.Frame(help_frame, bg=app.colors["background_medium"])
     tab_frame.pack(fill=tk.X, pady=10)
     
-    tabs = {
-        "Überblick": get_overview_help,
-        "Funktionen": get_features_help,
-        "Anleitung": get_tutorial_help,
-        "Fehlerbehebung": get_troubleshooting_help
-    }
+    # Beim Import vorbereitete Hilfetexte (Tabname -> Segmente)
+    tabs = _PARSED_HELP
     
     # Aktiver Tab
     active_tab = tk.StringVar(value="Überblick")
@@ -63,57 +72,65 @@ def show_help(app):
     )
     help_text.pack(fill=tk.BOTH, expand=True)
     
+    # Formatierungen für die Markdown-Segmente
+    family, size = app.fonts["normal"][0], app.fonts["normal"][1]
+    help_text.tag_configure("h1", font=app.fonts["header"], foreground=app.colors["primary"])
+    help_text.tag_configure("h2", font=app.fonts["subheader"])
+    help_text.tag_configure("h3", font=(family, size, "bold"))
+    help_text.tag_configure("bold", font=(family, size, "bold"))
+    
+    # Tab-Buttons (nach Tabname)
+    tab_buttons = {}
+    
+    # Funktion zum Wechseln der Tabs
+    def change_tab(tab_name):
+        active_tab.set(tab_name)
+        
+        # Tabs aktualisieren
+        for name, btn in tab_buttons.items():
+            btn.config(bg=app.colors["primary"] if name == tab_name else app.colors["background_dark"])
+        
+        # Hilfetext umschalten: nur der aktive Abschnitt bleibt sichtbar
+        for name in tabs:
+            help_text.tag_configure(f"tab:{name}", elide=(name != tab_name))
+        help_text.yview_moveto(0)
+    
     # Tab-Buttons erstellen
     for tab_name in tabs:
         tab_btn = create_button(
             app,
             tab_frame, 
             tab_name, 
-            lambda name=tab_name: change_tab(name),
+            partial(change_tab, tab_name),
             bg=app.colors["primary"] if tab_name == active_tab.get() else app.colors["background_dark"]
         )
         tab_btn.pack(side=tk.LEFT, padx=5)
+        tab_buttons[tab_name] = tab_btn
     
-    # Funktion zum Wechseln der Tabs
-    def change_tab(tab_name):
-        active_tab.set(tab_name)
-        
-        # Tabs aktualisieren
-        for i, child in enumerate(tab_frame.winfo_children()):
-            if isinstance(child, tk.Button):
-                tab_text = list(tabs.keys())[i]
-                if tab_text == tab_name:
-                    child.config(bg=app.colors["primary"])
-                else:
-                    child.config(bg=app.colors["background_dark"])
-        
-        # Hilfetext aktualisieren
-        help_text.config(state=tk.NORMAL)
-        help_text.delete(1.0, tk.END)
-        
-        # Hilfetextfunktion abrufen und ausführen
-        help_function = tabs[tab_name]
-        help_content = help_function()
-        
-        help_text.insert(tk.END, help_content)
-        help_text.config(state=tk.DISABLED)
-    
-    # Initial den Text für den aktiven Tab anzeigen
-    initial_content = get_overview_help()
-    help_text.insert(tk.END, initial_content)
+    # Alle Hilfetexte einmalig einfügen und je Tab per Tag ausblendbar machen
+    for name, segments in tabs.items():
+        tab_tag = f"tab:{name}"
+        for segment, tag in segments:
+            help_text.insert(tk.END, segment, (tab_tag, tag) if tag else tab_tag)
+        help_text.tag_configure(tab_tag, elide=(name != active_tab.get()))
     help_text.config(state=tk.DISABLED)
     
-    # Button zum Schließen
+    # Button zum Schließen (Fenster wird nur ausgeblendet)
     close_btn = create_button(
         app,
         help_frame, 
         "Schließen", 
-        help_window.destroy
+        help_window.withdraw
     )
     close_btn.pack(anchor=tk.E, pady=10)
+    help_window.protocol("WM_DELETE_WINDOW", help_window.withdraw)
+    
+    # Fenster für spätere Aufrufe merken
+    app._help_window = help_window
     
     return help_window
 
+@lru_cache(maxsize=1)
 def get_overview_help():
     """
     Liefert den Hilfetext für den Überblick
@@ -146,6 +163,7 @@ Die Anwendung verwendet standardmäßig die folgende Ordnerstruktur:
 - Problemordner: Hier werden Dokumente gespeichert, die nicht verarbeitet werden konnten oder als Duplikate erkannt wurden
 """
 
+@lru_cache(maxsize=1)
 def get_features_help():
     """
     Liefert den Hilfetext für die Funktionen
@@ -191,6 +209,7 @@ Das Protokoll zeigt alle Aktionen und Ereignisse der Anwendung an:
 - Erkannte Duplikate
 """
 
+@lru_cache(maxsize=1)
 def get_tutorial_help():
     """
     Liefert den Hilfetext für die Anleitung
@@ -232,6 +251,7 @@ Sie können Dateien auch direkt per Drag & Drop in die Anwendung ziehen, um sie
 Beachten Sie, dass diese Funktion die Installation von tkinterdnd2 erfordert.
 """
 
+@lru_cache(maxsize=1)
 def get_troubleshooting_help():
     """
     Liefert den Hilfetext für die Fehlerbehebung
@@ -280,4 +300,41 @@ def get_troubleshooting_help():
 - Nutzen Sie die Simulationsfunktion, um die Verarbeitung zu testen, bevor Sie Änderungen vornehmen
 
 Bei weiteren Fragen wenden Sie sich an support@maehrdocs.de
-"""
\ No newline at end of file
+"""
+
+def _parse_markdown(text):
+    """
+    Zerlegt einfachen Markdown-Text in (Text, Tag)-Segmente für ein Text-Widget
+    
+    Unterstützt Überschriften (#, ##, ###) und Fettdruck (**...**).
+    
+    Args:
+        text: Markdown-Text
+        
+    Returns:
+        list: Liste von (Segment, Tag oder None)
+    """
+    segments = []
+    for line in text.splitlines(keepends=True):
+        stripped = line.lstrip()
+        if stripped.startswith("#"):
+            level = len(stripped) - len(stripped.lstrip("#"))
+            segments.append((stripped[level:].lstrip(), f"h{min(level, 3)}"))
+            continue
+        
+        # Fettgedruckte Abschnitte stehen an ungeraden Positionen
+        for i, part in enumerate(line.split("**")):
+            if part:
+                segments.append((part, "bold" if i % 2 else None))
+    return segments
+
+# Hilfetexte einmalig beim Import aufbereiten
+_PARSED_HELP = {
+    name: _parse_markdown(help_function())
+    for name, help_function in (
+        ("Überblick", get_overview_help),
+        ("Funktionen", get_features_help),
+        ("Anleitung", get_tutorial_help),
+        ("Fehlerbehebung", get_troubleshooting_help)
+    )
+}
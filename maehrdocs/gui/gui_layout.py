@@ -8,10 +8,12 @@ Benutzeroberfläche sicher, die den Design-Standards der MaehrDocs-Anwendung ent
 """
 
 import tkinter as tk
+from functools import partial
 from tkinter import scrolledtext
 from datetime import datetime
 
 from .gui_buttons import create_button
+from .gui_logger import create_log_buffer
 from .gui_actions import (
     process_documents, 
     simulate_processing, 
@@ -19,6 +21,18 @@ from .gui_actions import (
     rebuild_config
 )
 
+def _pack_left(widget, padx=0, pady=0):
+    """Packt ein Widget linksbündig."""
+    widget.pack(side=tk.LEFT, padx=padx, pady=pady)
+
+def _pack_right(widget, padx=0, pady=0):
+    """Packt ein Widget rechtsbündig."""
+    widget.pack(side=tk.RIGHT, padx=padx, pady=pady)
+
+def _pack_fill_x(widget, padx=0, pady=0):
+    """Packt ein Widget über die volle Breite."""
+    widget.pack(fill=tk.X, padx=padx, pady=pady)
+
 def create_header(app, parent, settings_callback, help_callback):
     """
     Erstellt den Kopfbereich der GUI mit Logo, Titel und Funktionsschaltflächen.
@@ -35,23 +49,30 @@ def create_header(app, parent, settings_callback, help_callback):
     Returns:
         dict: Dictionary mit allen erstellten Header-Elementen für späteren Zugriff
     """
+    # Farben und Schriftarten einmalig nachschlagen
+    bg_dark = app.colors["background_dark"]
+    color_primary = app.colors["primary"]
+    fg_secondary = app.colors["text_secondary"]
+    font_header = app.fonts["header"]
+    font_normal = app.fonts["normal"]
+    
     header_elements = {}
     
     # Header-Frame erstellen
-    header_frame = tk.Frame(parent, bg=app.colors["background_dark"], padx=15, pady=15)
-    header_frame.pack(fill=tk.X)
+    header_frame = tk.Frame(parent, bg=bg_dark, padx=15, pady=15)
+    _pack_fill_x(header_frame)
     
     # Logo/Titel-Bereich
-    title_frame = tk.Frame(header_frame, bg=app.colors["background_dark"])
-    title_frame.pack(side=tk.LEFT)
+    title_frame = tk.Frame(header_frame, bg=bg_dark)
+    _pack_left(title_frame)
     
     # Haupttitel
     title_label = tk.Label(
         title_frame, 
         text="MaehrDocs", 
-        font=app.fonts["header"],
-        bg=app.colors["background_dark"],
-        fg=app.colors["primary"]
+        font=font_header,
+        bg=bg_dark,
+        fg=color_primary
     )
     title_label.pack(anchor=tk.W)
     
@@ -59,40 +80,31 @@ def create_header(app, parent, settings_callback, help_callback):
     subtitle_label = tk.Label(
         title_frame, 
         text="Automatisches Dokumentenmanagementsystem", 
-        font=app.fonts["normal"],
-        bg=app.colors["background_dark"],
-        fg=app.colors["text_secondary"]
+        font=font_normal,
+        bg=bg_dark,
+        fg=fg_secondary
     )
     subtitle_label.pack(anchor=tk.W)
     
     # Buttons-Bereich
-    buttons_frame = tk.Frame(header_frame, bg=app.colors["background_dark"])
-    buttons_frame.pack(side=tk.RIGHT)
-    
-    # Einstellungen-Button
-    settings_button = create_button(
-        app,
-        buttons_frame, 
-        "⚙️ Einstellungen", 
-        settings_callback
-    )
-    settings_button.pack(side=tk.RIGHT, padx=5)
-    
-    # Hilfe-Button
-    help_button = create_button(
-        app,
-        buttons_frame, 
-        "❓ Hilfe", 
-        help_callback
+    buttons_frame = tk.Frame(header_frame, bg=bg_dark)
+    _pack_right(buttons_frame)
+    
+    # Funktionsbuttons (von rechts nach links): (Elementschlüssel, Beschriftung, Callback)
+    button_specs = (
+        ("settings_button", "⚙️ Einstellungen", settings_callback),
+        ("help_button", "❓ Hilfe", help_callback)
     )
-    help_button.pack(side=tk.RIGHT, padx=5)
     
     # Elemente speichern
     header_elements["header_frame"] = header_frame
     header_elements["title_label"] = title_label
     header_elements["subtitle_label"] = subtitle_label
-    header_elements["settings_button"] = settings_button
-    header_elements["help_button"] = help_button
+    
+    for key, text, callback in button_specs:
+        button = create_button(app, buttons_frame, text, callback)
+        _pack_right(button, padx=5)
+        header_elements[key] = button
     
     return header_elements
 
@@ -111,69 +123,47 @@ def create_control_panel(app, parent):
     Returns:
         dict: Dictionary mit allen erstellten Steuerungselementen für späteren Zugriff
     """
+    # Farben und Schriftarten einmalig nachschlagen
+    bg_card = app.colors["card_background"]
+    fg_primary = app.colors["text_primary"]
+    font_subheader = app.fonts["subheader"]
+    
     control_elements = {}
     
     # Frame für das Steuerungspanel
-    control_frame = tk.Frame(parent, bg=app.colors["card_background"], padx=15, pady=15)
-    control_frame.pack(fill=tk.X, pady=10)
+    control_frame = tk.Frame(parent, bg=bg_card, padx=15, pady=15)
+    _pack_fill_x(control_frame, pady=10)
     
     # Überschrift
     control_header = tk.Label(
         control_frame, 
         text="Dokumentenverarbeitung", 
-        font=app.fonts["subheader"],
-        bg=app.colors["card_background"],
-        fg=app.colors["text_primary"]
+        font=font_subheader,
+        bg=bg_card,
+        fg=fg_primary
     )
     control_header.pack(anchor=tk.W, pady=(0, 10))
     
     # Buttons-Rahmen
-    buttons_frame = tk.Frame(control_frame, bg=app.colors["card_background"])
-    buttons_frame.pack(fill=tk.X)
-    
-    # Alle verarbeiten Button
-    process_button = create_button(
-        app,
-        buttons_frame, 
-        "📄 Alle Dokumente verarbeiten", 
-        lambda: process_documents(app)
+    buttons_frame = tk.Frame(control_frame, bg=bg_card)
+    _pack_fill_x(buttons_frame)
+    
+    # Aktionsbuttons: (Elementschlüssel, Beschriftung, Callback)
+    button_specs = (
+        ("process_button", "📄 Alle Dokumente verarbeiten", partial(process_documents, app)),
+        ("simulation_button", "🔍 Simulation (Dry-Run)", partial(simulate_processing, app)),
+        ("single_file_button", "📎 Einzelne Datei verarbeiten", partial(process_single_file, app)),
+        ("reset_config_button", "🔄 Konfiguration zurücksetzen", partial(rebuild_config, app))
     )
-    process_button.pack(side=tk.LEFT, padx=5, pady=5)
-    
-    # Simulation Button
-    simulation_button = create_button(
-        app,
-        buttons_frame, 
-        "🔍 Simulation (Dry-Run)", 
-        lambda: simulate_processing(app)
-    )
-    simulation_button.pack(side=tk.LEFT, padx=5, pady=5)
-    
-    # Einzelne Datei Button
-    single_file_button = create_button(
-        app,
-        buttons_frame, 
-        "📎 Einzelne Datei verarbeiten", 
-        lambda: process_single_file(app)
-    )
-    single_file_button.pack(side=tk.LEFT, padx=5, pady=5)
-    
-    # Konfiguration zurücksetzen Button
-    reset_config_button = create_button(
-        app,
-        buttons_frame, 
-        "🔄 Konfiguration zurücksetzen", 
-        lambda: rebuild_config(app)
-    )
-    reset_config_button.pack(side=tk.LEFT, padx=5, pady=5)
     
     # Elemente speichern
     control_elements["control_frame"] = control_frame
     control_elements["control_header"] = control_header
-    control_elements["process_button"] = process_button
-    control_elements["simulation_button"] = simulation_button
-    control_elements["single_file_button"] = single_file_button
-    control_elements["reset_config_button"] = reset_config_button
+    
+    for key, text, callback in button_specs:
+        button = create_button(app, buttons_frame, text, callback)
+        _pack_left(button, padx=5, pady=5)
+        control_elements[key] = button
     
     return control_elements
 
@@ -193,24 +183,31 @@ def create_log_panel(app, parent, clear_callback):
     Returns:
         dict: Dictionary mit allen erstellten Protokollelementen für späteren Zugriff
     """
+    # Farben und Schriftarten einmalig nachschlagen
+    bg_medium = app.colors["background_medium"]
+    bg_card = app.colors["card_background"]
+    fg_primary = app.colors["text_primary"]
+    font_subheader = app.fonts["subheader"]
+    font_code = app.fonts["code"]
+    
     log_elements = {}
     
     # Frame für den Protokollbereich
-    log_frame = tk.Frame(parent, bg=app.colors["background_medium"], padx=10, pady=10)
+    log_frame = tk.Frame(parent, bg=bg_medium, padx=10, pady=10)
     log_frame.pack(fill=tk.BOTH, expand=True, pady=10)
     
     # Überschrift
-    log_header = tk.Frame(log_frame, bg=app.colors["background_medium"])
-    log_header.pack(fill=tk.X, padx=5, pady=5)
+    log_header = tk.Frame(log_frame, bg=bg_medium)
+    _pack_fill_x(log_header, padx=5, pady=5)
     
     log_title = tk.Label(
         log_header, 
         text="Aktivitätsprotokoll", 
-        font=app.fonts["subheader"], 
-        bg=app.colors["background_medium"], 
-        fg=app.colors["text_primary"]
+        font=font_subheader, 
+        bg=bg_medium, 
+        fg=fg_primary
     )
-    log_title.pack(side=tk.LEFT)
+    _pack_left(log_title)
     
     # Löschen-Button
     clear_button = create_button(
@@ -219,20 +216,24 @@ def create_log_panel(app, parent, clear_callback):
         "Protokoll löschen", 
         clear_callback
     )
-    clear_button.pack(side=tk.RIGHT, padx=5)
+    _pack_right(clear_button, padx=5)
     
     # Textbereich mit Scrollbalken
     log_text = scrolledtext.ScrolledText(
         log_frame,
         wrap=tk.WORD,
-        font=app.fonts["code"],
-        bg=app.colors["card_background"],
-        fg=app.colors["text_primary"],
+        font=font_code,
+        bg=bg_card,
+        fg=fg_primary,
         height=15
     )
     log_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
     log_text.config(state=tk.DISABLED)  # Schreibgeschützt
     
+    # Gepuffertes Anhängen an das Protokoll
+    append_log = create_log_buffer(app, log_text)
+    log_text.append_log = append_log
+    
     # Elemente speichern
     log_elements["log_frame"] = log_frame
     log_elements["log_title"] = log_title
@@ -256,33 +257,38 @@ def create_status_bar(app, parent):
     Returns:
         dict: Dictionary mit allen erstellten Statuselementen für späteren Zugriff
     """
+    # Farben und Schriftarten einmalig nachschlagen
+    bg_dark = app.colors["background_dark"]
+    fg_secondary = app.colors["text_secondary"]
+    font_small = app.fonts["small"]
+    
     status_elements = {}
     
     # Frame für die Statusleiste
-    status_frame = tk.Frame(parent, bg=app.colors["background_dark"])
+    status_frame = tk.Frame(parent, bg=bg_dark)
     status_frame.pack(fill=tk.X, side=tk.BOTTOM, pady=(10, 0))
     
     # Status-Label
     status_label = tk.Label(
         status_frame,
         text="Bereit",
-        font=app.fonts["small"],
-        bg=app.colors["background_dark"],
-        fg=app.colors["text_secondary"],
+        font=font_small,
+        bg=bg_dark,
+        fg=fg_secondary,
         anchor=tk.W
     )
-    status_label.pack(side=tk.LEFT, padx=5)
+    _pack_left(status_label, padx=5)
     
     # Version und Copyright
     version_label = tk.Label(
         status_frame,
         text="MaehrDocs v2.0.0 | © 2025 René Mähr",
-        font=app.fonts["small"],
-        bg=app.colors["background_dark"],
-        fg=app.colors["text_secondary"],
+        font=font_small,
+        bg=bg_dark,
+        fg=fg_secondary,
         anchor=tk.E
     )
-    version_label.pack(side=tk.RIGHT, padx=5)
+    _pack_right(version_label, padx=5)
     
     # Elemente speichern
     status_elements["status_frame"] = status_frame
@@ -9,7 +9,52 @@ und sorgt für konsistente und gut sichtbare Statusmeldungen während der Anwend
 
 import tkinter as tk
 import logging
-from datetime import datetime
+import queue
+import threading
+import time
+
+# Intervall, in dem der GUI-Thread gepufferte Protokolleinträge gesammelt schreibt (ms)
+LOG_FLUSH_DELAY_MS = 50
+
+# Standardwert für die maximale Zeilenzahl im Protokollbereich
+# (überschreibbar über gui.log_max_lines in der Konfiguration)
+LOG_MAX_LINES = 5000
+
+# Zusätzlich entfernte Zeilen beim Kürzen, damit nicht bei jedem Eintrag gekürzt wird
+# (bei kleinen Limits höchstens ein Zehntel der maximalen Zeilenzahl)
+LOG_TRIM_CHUNK = 500
+
+# Level -> (Tag, Präfix, Logging-Level) für Protokolleinträge
+LOG_LEVELS = {
+    "error": ("error", "❌ FEHLER", logging.ERROR),
+    "warning": ("warning", "⚠️ WARNUNG", logging.WARNING),
+    "success": ("success", "✅ ERFOLG", logging.INFO),
+    "duplicate": ("duplicate", "🔄 DUPLIKAT", logging.INFO),
+    "info": ("info", "ℹ️ INFO", logging.INFO)
+}
+
+# Puffergröße (Bytes) und Abschnittsgröße (Zeilen) für den Protokollexport
+EXPORT_BUFFER_SIZE = 128 * 1024
+EXPORT_CHUNK_LINES = 1000
+
+# Zuletzt formatierter Zeitstempel als (Sekunde seit Epoche, "HH:MM:SS")
+_timestamp_cache = (None, "")
+
+def _timestamp():
+    """
+    Liefert die aktuelle Uhrzeit als "HH:MM:SS".
+    
+    Die Formatierung erfolgt höchstens einmal pro Sekunde; innerhalb derselben
+    Sekunde wird der zwischengespeicherte String wiederverwendet.
+    
+    Returns:
+        str: Formatierter Zeitstempel
+    """
+    global _timestamp_cache
+    now = int(time.time())
+    if now != _timestamp_cache[0]:
+        _timestamp_cache = (now, time.strftime("%H:%M:%S", time.localtime(now)))
+    return _timestamp_cache[1]
 
 def setup_logging(app):
     """
@@ -39,6 +84,88 @@ def setup_logging(app):
     
     app.log_text.config(state=tk.DISABLED)
 
+def create_log_buffer(app, log_text):
+    """
+    Erstellt eine gepufferte Schreibfunktion für den Protokollbereich.
+    
+    Einträge werden gesammelt und alle LOG_FLUSH_DELAY_MS gemeinsam geschrieben:
+    ein Zustandswechsel, ein insert() je Tag-Gruppe, ein see() und eine einzige
+    Aktualisierung der Aktivitätsanzeige mit der letzten Nachricht. Mit
+    immediate=True wird der Puffer sofort geleert (z.B. für Fehler), sofern
+    der Aufruf aus dem GUI-Thread kommt.
+    
+    append_log darf aus beliebigen Threads aufgerufen werden: Es legt Einträge
+    nur in einer threadsicheren Queue ab. Alle Tk-Zugriffe erfolgen in der
+    after()-Schleife des GUI-Threads, der den Puffer erstellt hat.
+    
+    Args:
+        app: Die GuiApp-Instanz
+        log_text: Das Text-Widget des Protokollbereichs
+        
+    Returns:
+        function: append_log(entry, tag=(), message=None, immediate=False)
+    """
+    pending = queue.SimpleQueue()
+    gui_thread = threading.current_thread()
+    max_lines = app.config.get("gui", {}).get("log_max_lines", LOG_MAX_LINES)
+    trim_chunk = min(LOG_TRIM_CHUNK, max_lines // 10)
+    
+    # Anzahl der Zeilen im Textfeld (wird beim Löschen des Protokolls zurückgesetzt)
+    log_text._line_count = 0
+    
+    def flush_log():
+        # Aufeinanderfolgende Einträge mit gleichem Tag zusammenfassen
+        groups = []
+        last_message = None
+        while True:
+            try:
+                entry, tag, message = pending.get_nowait()
+            except queue.Empty:
+                break
+            if groups and groups[-1][1] == tag:
+                groups[-1][0].append(entry)
+            else:
+                groups.append(([entry], tag))
+            if message is not None:
+                last_message = message
+        
+        if not groups:
+            return
+        
+        log_text.config(state=tk.NORMAL)
+        for entries, tag in groups:
+            text = "".join(entries)
+            log_text.insert(tk.END, text, tag)
+            log_text._line_count += text.count("\n")
+        
+        # Älteste Zeilen in einem Block entfernen, sobald das Limit überschritten ist
+        if log_text._line_count > max_lines:
+            excess = log_text._line_count - max_lines + trim_chunk
+            log_text.delete("1.0", f"{excess + 1}.0")
+            log_text._line_count = max(0, log_text._line_count - excess)
+        
+        log_text.see(tk.END)
+        log_text.config(state=tk.DISABLED)
+        
+        # Letzte Aktivität nur einmal pro Durchlauf aktualisieren
+        if last_message is not None:
+            update_activity_display(app, last_message)
+    
+    def flush_loop():
+        # Schleife endet mit dem Protokollbereich
+        if not log_text.winfo_exists():
+            return
+        flush_log()
+        log_text.after(LOG_FLUSH_DELAY_MS, flush_loop)
+    
+    def append_log(entry, tag=(), message=None, immediate=False):
+        pending.put((entry, tag, message))
+        if immediate and threading.current_thread() is gui_thread:
+            flush_log()
+    
+    log_text.after(LOG_FLUSH_DELAY_MS, flush_loop)
+    return append_log
+
 def log_message(app, message, level="info"):
     """
     Fügt eine formatierte Nachricht zum Protokollbereich der GUI hinzu.
@@ -56,30 +183,10 @@ def log_message(app, message, level="info"):
         return
         
     # Aktuelle Zeit
-    timestamp = datetime.now().strftime("%H:%M:%S")
+    timestamp = _timestamp()
     
     # Farbe und Präfix je nach Level
-    tag = None
-    if level == "error":
-        tag = "error"
-        prefix = "❌ FEHLER"
-        log_level = logging.ERROR
-    elif level == "warning":
-        tag = "warning"
-        prefix = "⚠️ WARNUNG"
-        log_level = logging.WARNING
-    elif level == "success":
-        tag = "success"
-        prefix = "✅ ERFOLG"
-        log_level = logging.INFO
-    elif level == "duplicate":
-        tag = "duplicate"
-        prefix = "🔄 DUPLIKAT"  # Neues Symbol für Duplikate
-        log_level = logging.INFO
-    else:
-        tag = "info"
-        prefix = "ℹ️ INFO"
-        log_level = logging.INFO
+    tag, prefix, log_level = LOG_LEVELS.get(level, LOG_LEVELS["info"])
     
     # Log an Logger-Objekt senden
     if hasattr(app, 'logger'):
@@ -88,14 +195,19 @@ def log_message(app, message, level="info"):
     # Log-Eintrag formatieren
     log_entry = f"[{timestamp}] {prefix}: {message}\n"
     
-    # Text-Widget aktualisieren
-    app.log_text.config(state=tk.NORMAL)
-    
     # Tags erstellen, falls noch nicht vorhanden
     if not hasattr(app.log_text, 'tags_created'):
         setup_logging(app)
     
-    # Text einfügen
+    # Gepuffert anhängen, wenn das Protokollpanel dies unterstützt
+    # (Fehler werden sofort geschrieben; die Aktivitätsanzeige folgt beim Schreiben)
+    append_log = getattr(app.log_text, 'append_log', None)
+    if append_log is not None:
+        append_log(log_entry, tag, message, immediate=(level == "error"))
+        return
+    
+    # Text-Widget direkt aktualisieren
+    app.log_text.config(state=tk.NORMAL)
     app.log_text.insert(tk.END, log_entry, tag)
     
     # Zum Ende scrollen
@@ -120,11 +232,7 @@ def update_activity_display(app, message):
         message (str): Die anzuzeigende Nachricht
     """
     if hasattr(app, 'dashboard_elements') and "activity_list" in app.dashboard_elements:
-        activity_list = app.dashboard_elements["activity_list"]
-        activity_list.config(state=tk.NORMAL)
-        activity_list.delete(1.0, tk.END)
-        activity_list.insert(tk.END, message)
-        activity_list.config(state=tk.DISABLED)
+        app.dashboard_elements["activity_list"].configure(text=message)
 
 def export_log(app, filepath=None):
     """
@@ -155,14 +263,12 @@ def export_log(app, filepath=None):
             if not filepath:  # Benutzer hat abgebrochen
                 return False
         
-        # Protokollinhalt holen
-        app.log_text.config(state=tk.NORMAL)
-        log_content = app.log_text.get(1.0, tk.END)
-        app.log_text.config(state=tk.DISABLED)
-        
-        # In Datei schreiben
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(log_content)
+        # Protokollinhalt abschnittsweise in eine groß gepufferte Datei schreiben,
+        # ohne das gesamte Protokoll auf einmal als String zu erzeugen
+        last_line = int(app.log_text.index(tk.END).split(".")[0])
+        with open(filepath, 'w', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
+            for start in range(1, last_line, EXPORT_CHUNK_LINES):
+                f.write(app.log_text.get(f"{start}.0", f"{start + EXPORT_CHUNK_LINES}.0"))
         
         log_message(app, f"Protokoll exportiert nach: {filepath}", level="success")
         return True
@@ -4,6 +4,16 @@ Bietet eine einheitliche Schnittstelle für alle Arten von Benachrichtigungen,
 Dialogen und Feedback-Mechanismen in der Anwendung.
 """
 
+from .gui_logger import log_message
+from .gui_notifications import show_notification
+from .gui_toast import show_toast
+from .gui_dialog import (
+    show_info_dialog, 
+    show_warning_dialog, 
+    show_error_dialog, 
+    show_confirm_dialog
+)
+
 class MessagingSystem:
     """
     Zentrale Klasse für alle Benachrichtigungen und Dialoge.
@@ -44,16 +54,13 @@ class MessagingSystem:
         """
         # Logging
         if log:
-            from .gui_logger import log_message
             log_message(self.app, message, level)
         
         # Visuelle Benachrichtigung
         if visual:
             if toast:
-                from .gui_toast import show_toast
                 return show_toast(self.app, message, duration=timeout)
             else:
-                from .gui_notifications import show_notification
                 return show_notification(self.app, message, level=level, timeout=timeout)
         
         return None
@@ -71,13 +78,6 @@ class MessagingSystem:
             Bei confirm: bool (Bestätigung)
             Bei anderen Typen: None
         """
-        from .gui_dialog import (
-            show_info_dialog, 
-            show_warning_dialog, 
-            show_error_dialog, 
-            show_confirm_dialog
-        )
-        
         if type == "confirm":
             return show_confirm_dialog(self.app, title, message)
         elif type == "warning":
@@ -3,6 +3,57 @@ Benachrichtigungshandler für MaehrDocs
 Enthält Funktionen zur Verarbeitung von speziellen Benachrichtigungen
 """
 
+import json
+import re
+
+# Präfix der strukturierten Duplikatmeldung aus dem Verarbeitungsprozess
+DUPLICATE_JSON_PREFIX = "DUPLIKAT_ERKANNT_JSON:"
+
+# Älteres Textformat mit eckigen Klammern
+_BRACKETED_DUPLICATE_RE = re.compile(
+    r"\[Original:\s*([^\]]+)\]\s*\[Duplicate:\s*([^\]]+)\]\s*\[Similarity:\s*([^\]]+)\]"
+)
+
+def parse_duplicate_line(log_line):
+    """
+    Extrahiert Duplikatinformationen aus einer Protokollzeile
+    
+    Unterstützt die strukturierte JSON-Meldung sowie die älteren Textformate
+    ("DUPLIKAT_ERKANNT|orig|dup|sim" und "[Original: ...] [Duplicate: ...] [Similarity: ...]").
+    
+    Args:
+        log_line: Log-Zeile mit Duplikatinformationen
+        
+    Returns:
+        tuple: (original_file, duplicate_file, similarity_score) oder None
+    """
+    # Strukturierte Meldung - wird in einem Schritt geparst
+    if log_line.startswith(DUPLICATE_JSON_PREFIX):
+        try:
+            data = json.loads(log_line[len(DUPLICATE_JSON_PREFIX):])
+            return data['orig'], data['dup'], float(data['sim'])
+        except (ValueError, KeyError, TypeError):
+            return None
+    
+    # Älteres Format mit Pipe-Trennzeichen
+    if "DUPLIKAT_ERKANNT|" in log_line:
+        parts = log_line.split("|")
+        if len(parts) >= 4:
+            try:
+                return parts[1], parts[2], float(parts[3])
+            except ValueError:
+                return None
+        return None
+    
+    # Format: "DUPLICATE DETECTED: [Original: file1.pdf] [Duplicate: file2.pdf] [Similarity: 0.92]"
+    if "[Similarity:" in log_line:
+        match = _BRACKETED_DUPLICATE_RE.search(log_line)
+        if match:
+            original_file, duplicate_file, similarity_str = match.groups()
+            return original_file.strip(), duplicate_file.strip(), float(similarity_str)
+    
+    return None
+
 def handle_duplicate_from_log(app, log_line):
     """
     Verarbeitet Duplikatbenachrichtigungen aus der Protokollausgabe
@@ -12,24 +63,9 @@ def handle_duplicate_from_log(app, log_line):
         log_line: Log-Zeile mit Duplikatinformationen
     """
     try:
-        # Aus dem Log-Text die relevanten Informationen extrahieren
-        # Format könnte sein: "DUPLICATE DETECTED: [Original: file1.pdf] [Duplicate: file2.pdf] [Similarity: 0.92]"
-        if "[Original:" in log_line and "[Duplicate:" in log_line and "[Similarity:" in log_line:
-            # Original-Datei extrahieren
-            original_start = log_line.find("[Original:") + 10
-            original_end = log_line.find("]", original_start)
-            original_file = log_line[original_start:original_end].strip()
-            
-            # Duplikat-Datei extrahieren
-            duplicate_start = log_line.find("[Duplicate:") + 11
-            duplicate_end = log_line.find("]", duplicate_start)
-            duplicate_file = log_line[duplicate_start:duplicate_end].strip()
-            
-            # Ähnlichkeitswert extrahieren
-            similarity_start = log_line.find("[Similarity:") + 12
-            similarity_end = log_line.find("]", similarity_start)
-            similarity_str = log_line[similarity_start:similarity_end].strip()
-            similarity_score = float(similarity_str)
+        duplicate_info = parse_duplicate_line(log_line)
+        if duplicate_info:
+            original_file, duplicate_file, similarity_score = duplicate_info
             
             # Log mit dem neuen Level
             app.log(f"Duplikat erkannt: {duplicate_file} ist identisch mit {original_file} (Ähnlichkeit: {similarity_score:.2f})", level="duplicate")
@@ -42,4 +78,4 @@ def handle_duplicate_from_log(app, log_line):
         app.messaging.notify(
             f"Fehler bei der Verarbeitung der Duplikatbenachrichtigung: {str(e)}", 
             level="error"
-        )
\ No newline at end of file
+        )
@@ -6,9 +6,36 @@ Dieses Modul enthält die Kernfunktionalität für das Anzeigen von
 Benachrichtigungen verschiedener Dringlichkeitsstufen (Info, Erfolg, Warnung, Fehler).
 """
 import logging
+import time
 import tkinter as tk
 from .gui_animations import animate_window, fade_in, fade_out
 
+# Icons je nach Level
+NOTIFICATION_ICONS = {
+    "info": "ℹ️",
+    "success": "✅",
+    "warning": "⚠️",
+    "error": "❌"
+}
+
+# Logging-Level je nach Benachrichtigungslevel
+NOTIFICATION_LOG_LEVELS = {
+    "info": logging.INFO,
+    "success": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR
+}
+
+# Maximale Anzahl verborgener Benachrichtigungsfenster zur Wiederverwendung
+NOTIFICATION_POOL_SIZE = 3
+
+# Abstand der Benachrichtigung zum rechten und unteren Bildschirmrand (px)
+NOTIFICATION_MARGIN_X = 20
+NOTIFICATION_MARGIN_Y = 40
+
+# Zeitfenster (Sekunden), in dem gleiche Benachrichtigungen verworfen werden
+NOTIFICATION_DEDUP_SECONDS = 0.5
+
 def show_notification(app, message, level="info", timeout=5000):
     """
     Zeigt eine Benachrichtigung an.
@@ -23,8 +50,28 @@ def show_notification(app, message, level="info", timeout=5000):
         timeout (int): Anzeigedauer in Millisekunden
         
     Returns:
-        tk.Toplevel: Das erzeugte Benachrichtigungsfenster
+        tk.Toplevel: Das erzeugte Benachrichtigungsfenster oder None, wenn
+        keine Benachrichtigung angezeigt wurde
     """
+    # Auch in die Log-Datei schreiben
+    if hasattr(app, 'logger'):
+        app.logger.log(NOTIFICATION_LOG_LEVELS.get(level, logging.INFO), message)
+    
+    # Keine Popups, solange das Hauptfenster minimiert oder nicht sichtbar ist
+    try:
+        hidden = app.root.state() == "iconic" or not app.root.winfo_viewable()
+    except tk.TclError:
+        hidden = True
+    if hidden:
+        return None
+    
+    # Identische Benachrichtigungen kurz hintereinander nur einmal anzeigen
+    now = time.monotonic()
+    last = getattr(app, '_notif_last', None)
+    if last is not None and last[0] == (level, message) and now - last[1] < NOTIFICATION_DEDUP_SECONDS:
+        return None
+    app._notif_last = ((level, message), now)
+    
     # Farben je nach Level
     colors = {
         "info": app.colors["primary"],
@@ -32,37 +79,71 @@ def show_notification(app, message, level="info", timeout=5000):
         "warning": app.colors["warning"],
         "error": app.colors["error"]
     }
+    bg_color = colors.get(level, app.colors["primary"])
     
-    # Icons je nach Level
-    icons = {
-        "info": "ℹ️",
-        "success": "✅",
-        "warning": "⚠️",
-        "error": "❌"
-    }
+    # Freies Fenster aus dem Pool verwenden oder einmalig neu erstellen
+    pool = getattr(app, '_notif_pool', None)
+    if pool is None:
+        pool = app._notif_pool = []
+    notif_window = None
+    while pool and notif_window is None:
+        candidate = pool.pop()
+        if candidate.winfo_exists():
+            notif_window = candidate
+    if notif_window is None:
+        notif_window = _create_notification_window(app)
+    
+    # Inhalt und Styling aktualisieren
+    notif_window._notif_token += 1
+    notif_window._closing = False
+    notif_window.configure(bg=bg_color)
+    notif_window._content_frame.config(bg=bg_color)
+    notif_window._icon_label.config(text=NOTIFICATION_ICONS.get(level, "ℹ️"), bg=bg_color)
+    notif_window._message_label.config(text=message, bg=bg_color)
+    notif_window._close_label.config(bg=bg_color)
+    
+    # Position rechts unten: negative Offsets beziehen sich auf den rechten bzw.
+    # unteren Bildschirmrand, Tk berechnet die Lage beim Anzeigen selbst
+    # (kein update_idletasks und keine Abfrage der Bildschirmgröße nötig)
+    notif_window.geometry(f"-{NOTIFICATION_MARGIN_X}-{NOTIFICATION_MARGIN_Y}")
+    notif_window.deiconify()
     
-    # Fenster erstellen
+    # Animation starten
+    animate_window(notif_window)
+    
+    # Automatisch schließen nach timeout (nur, wenn das Fenster bis dahin nicht neu belegt wurde)
+    if timeout > 0:
+        token = notif_window._notif_token
+        notif_window.after(timeout, lambda: _hide_notification(app, notif_window, token))
+    
+    return notif_window
+
+def _create_notification_window(app):
+    """
+    Erstellt ein (verborgenes) Benachrichtigungsfenster für den Pool.
+    
+    Die Widgets werden als Attribute am Fenster gespeichert, damit sie bei
+    jeder Wiederverwendung nur noch neu beschriftet werden müssen.
+    
+    Args:
+        app: Die GuiApp-Instanz
+        
+    Returns:
+        tk.Toplevel: Das verborgene Benachrichtigungsfenster
+    """
     notif_window = tk.Toplevel(app.root)
+    notif_window.withdraw()
     notif_window.overrideredirect(True)  # Kein Fensterrahmen
     notif_window.attributes("-topmost", True)  # Immer im Vordergrund
     
-    # Styling
-    bg_color = colors.get(level, app.colors["primary"])
-    notif_window.configure(bg=bg_color)
-    
-    # Abstandhalter für Padding
-    padx, pady = 15, 10
-    
     # Frame für Inhalt
-    content_frame = tk.Frame(notif_window, bg=bg_color, padx=padx, pady=pady)
+    content_frame = tk.Frame(notif_window, padx=15, pady=10)
     content_frame.pack(fill=tk.BOTH, expand=True)
     
     # Icon
     icon_label = tk.Label(
         content_frame,
-        text=icons.get(level, "ℹ️"),
         font=("Segoe UI", 16),
-        bg=bg_color,
         fg=app.colors["text_primary"]
     )
     icon_label.pack(side=tk.LEFT, padx=(0, 10))
@@ -70,9 +151,7 @@ def show_notification(app, message, level="info", timeout=5000):
     # Nachricht
     message_label = tk.Label(
         content_frame,
-        text=message,
         font=app.fonts["normal"],
-        bg=bg_color,
         fg=app.colors["text_primary"],
         wraplength=400,
         justify=tk.LEFT
@@ -80,46 +159,65 @@ def show_notification(app, message, level="info", timeout=5000):
     message_label.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
     
     # Schließen-Button
-    close_btn = tk.Label(
+    close_label = tk.Label(
         content_frame,
         text="✖",
         font=("Segoe UI", 12),
-        bg=bg_color,
         fg=app.colors["text_primary"],
         cursor="hand2"
     )
-    close_btn.pack(side=tk.RIGHT, padx=(10, 0))
-    close_btn.bind("<Button-1>", lambda e: fade_out(notif_window))
-    
-    # Position berechnen (rechts unten)
-    notif_window.update_idletasks()
-    width = notif_window.winfo_width()
-    height = notif_window.winfo_height()
+    close_label.pack(side=tk.RIGHT, padx=(10, 0))
+    close_label.bind("<Button-1>", lambda e: _hide_notification(app, notif_window))
     
-    screen_width = app.root.winfo_screenwidth()
-    screen_height = app.root.winfo_screenheight()
+    notif_window._content_frame = content_frame
+    notif_window._icon_label = icon_label
+    notif_window._message_label = message_label
+    notif_window._close_label = close_label
+    notif_window._notif_token = 0
+    notif_window._closing = False
     
-    x = screen_width - width - 20
-    y = screen_height - height - 40
-    
-    notif_window.geometry(f"+{x}+{y}")
+    return notif_window
+
+def _hide_notification(app, notif_window, token=None):
+    """
+    Blendet eine Benachrichtigung aus und gibt das Fenster an den Pool zurück.
     
-    # Animation starten
-    animate_window(notif_window)
+    Args:
+        app: Die GuiApp-Instanz
+        notif_window: Das Benachrichtigungsfenster
+        token: Kennung der Anzeige, zu der ein Timer gehört (None bei Klick)
+    """
+    if not notif_window.winfo_exists():
+        return
+    
+    # Veraltete Timer einer früheren Anzeige ignorieren
+    if token is not None and token != notif_window._notif_token:
+        return
+    if notif_window._closing:
+        return
+    notif_window._closing = True
+    
+    fade_out(
+        notif_window,
+        destroy_window=False,
+        on_done=lambda: _release_notification_window(app, notif_window)
+    )
+
+def _release_notification_window(app, notif_window):
+    """
+    Verbirgt ein Benachrichtigungsfenster und legt es in den Pool zurück.
     
-    # Automatisch schließen nach timeout
-    if timeout > 0:
-        notif_window.after(timeout, lambda: fade_out(notif_window))
+    Args:
+        app: Die GuiApp-Instanz
+        notif_window: Das Benachrichtigungsfenster
+    """
+    notif_window.withdraw()
     
-    # Auch in die Log-Datei schreiben
-    if hasattr(app, 'logger'):
-        log_level = {
-            "info": logging.INFO,
-            "success": logging.INFO,
-            "warning": logging.WARNING,
-            "error": logging.ERROR
-        }.get(level, logging.INFO)
-        
-        app.logger.log(log_level, message)
+    pool = getattr(app, '_notif_pool', None)
+    if pool is None:
+        pool = app._notif_pool = []
     
-    return notif_window
\ No newline at end of file
+    if len(pool) < NOTIFICATION_POOL_SIZE:
+        pool.append(notif_window)
+    else:
+        notif_window.destroy()
@@ -10,7 +10,8 @@ from .gui_settings_components import (
     create_settings_section,
     create_settings_tab,
     collect_settings_from_widget,
-    search_and_update_field
+    refresh_settings_fields,
+    reset_settings_field_cache
 )
 
 # Importiere Funktionen aus dem Dialogmodul
@@ -29,7 +30,8 @@ __all__ = [
     'create_settings_section',
     'create_settings_tab',
     'collect_settings_from_widget',
-    'search_and_update_field',
+    'refresh_settings_fields',
+    'reset_settings_field_cache',
     'open_settings',
     'create_general_tab',
     'create_openai_tab',
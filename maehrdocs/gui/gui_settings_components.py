@@ -6,7 +6,7 @@ Enthält Funktionen zum Erstellen von Einstellungssektionen und -tabs
 
 import tkinter as tk
 from tkinter import ttk
-from .gui_forms import create_form_field
+from .gui_forms import create_form_field, configure_form_styles, _get_config_value
 
 def create_settings_section(app, parent, title, fields):
     """
@@ -19,29 +19,37 @@ def create_settings_section(app, parent, title, fields):
         fields: Liste der Felder
         
     Returns:
-        tk.Frame: Der erstellte Abschnitt
+        ttk.Frame: Der erstellte Abschnitt
     """
-    section_frame = tk.Frame(
+    # Gemeinsame Stile statt Farben und Schriftarten je Widget
+    configure_form_styles(app)
+    
+    section_frame = ttk.Frame(
         parent, 
-        bg=app.colors["card_background"], 
-        padx=15, 
-        pady=15
+        style="Settings.Card.TFrame",
+        padding=15
     )
-    section_frame.pack(fill=tk.X, pady=10)
     
-    section_header = tk.Label(
+    section_header = ttk.Label(
         section_frame, 
         text=title, 
-        font=app.fonts["subheader"],
-        fg=app.colors["text_primary"],
-        bg=app.colors["card_background"]
+        style="Settings.Subheader.TLabel"
     )
-    section_header.pack(anchor=tk.W, pady=(0, 10))
+    section_header.grid(row=0, column=0, columnspan=3, sticky=tk.W, pady=(0, 10))
+    
+    # Eingabespalte füllt die verfügbare Breite
+    section_frame.grid_columnconfigure(1, weight=1)
     
-    # Felder erstellen
-    for field in fields:
-        field_frame = create_form_field(app, section_frame, field)
-        field_frame.pack(fill=tk.X, pady=5)
+    # Felder direkt im Grid des Abschnitts erstellen (eine Zeile pro Feld)
+    for row, field in enumerate(fields, start=1):
+        input_field = create_form_field(app, section_frame, field, row)
+        
+        # Feld registrieren, damit beim Speichern kein Widget-Baum durchsucht werden muss
+        if input_field is not None:
+            app._settings_fields.append(input_field)
+    
+    # Abschnitt erst nach dem Befüllen einhängen, damit das Layout nur einmal berechnet wird
+    section_frame.pack(fill=tk.X, pady=10)
     
     return section_frame
 
@@ -58,17 +66,20 @@ def create_settings_tab(app, notebook, title, sections):
     Returns:
         tk.Frame: Der erstellte Tab-Frame
     """
-    tab_frame = tk.Frame(notebook, bg=app.colors["background_medium"])
+    # Hintergrundfarbe einmalig nachschlagen
+    bg_med = app.colors["background_medium"]
+    
+    tab_frame = tk.Frame(notebook, bg=bg_med)
     notebook.add(tab_frame, text=title)
     
     # Scrollable Bereich erstellen
     canvas = tk.Canvas(
         tab_frame, 
-        bg=app.colors["background_medium"],
+        bg=bg_med,
         highlightthickness=0
     )
     scrollbar = tk.Scrollbar(tab_frame, orient=tk.VERTICAL, command=canvas.yview)
-    content_frame = tk.Frame(canvas, bg=app.colors["background_medium"])
+    content_frame = tk.Frame(canvas, bg=bg_med)
     
     content_frame.bind(
         "<Configure>",
@@ -92,70 +103,134 @@ def create_settings_tab(app, notebook, title, sections):
     
     return tab_frame
 
-def collect_settings_from_widget(app, widget):
+def collect_settings_from_widget(app, widget=None):
     """
-    Sammelt rekursiv alle Einstellungen aus Widgets
+    Sammelt alle Einstellungen aus den registrierten Eingabefeldern
     
     Args:
         app: Instanz der GuiApp
-        widget: Das zu durchsuchende Widget
-    """
-    # Prüfen, ob das Widget ein Feld mit einem Wert ist
-    if hasattr(widget, 'field_key') and hasattr(widget, 'field_type'):
-        # Wert entsprechend dem Feldtyp extrahieren
-        value = None
-        if widget.field_type == 'text' or widget.field_type == 'folder':
-            value = widget.get()
-        elif widget.field_type == 'dropdown':
-            value = widget.get()
-        elif widget.field_type == 'spinbox':
-            try:
-                value = int(widget.get())
-            except ValueError:
-                try:
-                    value = float(widget.get())
-                except ValueError:
-                    value = widget.get()
-        elif widget.field_type == 'scale':
-            value = widget.get()
-        elif widget.field_type == 'checkbox':
-            value = widget.var.get()
-            
-        # Wert in der Konfiguration speichern
-        keys = widget.field_key.split('.')
-        current = app.config
-        for i, key in enumerate(keys):
-            if i == len(keys) - 1:
-                current[key] = value
-            else:
-                if key not in current:
-                    current[key] = {}
-                current = current[key]
-    
-    # Rekursiv für alle Kind-Widgets aufrufen
-    if hasattr(widget, 'winfo_children'):
-        for child in widget.winfo_children():
-            collect_settings_from_widget(app, child)
+        widget: Wird nicht mehr benötigt (Abwärtskompatibilität)
+        
+    Returns:
+        bool: True, wenn sich mindestens ein Wert geändert hat
+    """
+    changed = False
+    for field in app._settings_fields:
+        if _store_field_value(app, field):
+            changed = True
+    
+    return changed
+
+def refresh_settings_fields(app):
+    """
+    Setzt alle registrierten Eingabefelder auf die Werte der Konfiguration
+    
+    Args:
+        app: Instanz der GuiApp
+    """
+    for field in app._settings_fields:
+        _load_field_value(app, field)
+
+def reset_settings_field_cache(app):
+    """
+    Verwirft die zwischengespeicherten Konfigurationspfade aller Eingabefelder
+    
+    Nötig, wenn der Inhalt von app.config ersetzt wurde, das Objekt selbst
+    aber dasselbe bleibt.
+    
+    Args:
+        app: Instanz der GuiApp
+    """
+    for field in app._settings_fields:
+        field._config_ref = None
 
-def search_and_update_field(widget, field_key, value):
+def _load_field_value(app, widget):
     """
-    Durchsucht ein Widget nach einem Feld und aktualisiert dessen Wert
+    Überträgt den Konfigurationswert eines Feldes in das Widget
     
     Args:
-        widget: Das zu durchsuchende Widget
-        field_key: Schlüssel des gesuchten Feldes
-        value: Neuer Wert für das Feld
+        app: Instanz der GuiApp
+        widget: Eingabefeld mit field_key und field_type
     """
-    # Prüfen, ob das Widget das gesuchte Feld ist
-    if hasattr(widget, 'field_key') and widget.field_key == field_key:
+    value = _get_config_value(app, widget._key_parts)
+    
+    if widget.field_type in ('text', 'folder'):
         widget.delete(0, tk.END)
-        widget.insert(0, value)
-        return True
+        if isinstance(value, str):
+            widget.insert(0, value)
+    elif widget.field_type == 'dropdown':
+        if isinstance(value, str) and value in widget['values']:
+            widget.set(value)
+    elif widget.field_type == 'spinbox':
+        if isinstance(value, (int, float)):
+            widget.delete(0, tk.END)
+            widget.insert(0, str(value))
+    elif widget.field_type == 'scale':
+        if isinstance(value, (int, float)):
+            widget.set(value)
+    elif widget.field_type == 'checkbox':
+        widget.var.set(bool(value))
+
+def _store_field_value(app, widget):
+    """
+    Liest den Wert eines Feldes aus und speichert ihn in der Konfiguration
     
-    # Rekursiv für alle Kind-Widgets aufrufen
-    if hasattr(widget, 'winfo_children'):
-        for child in widget.winfo_children():
-            if search_and_update_field(child, field_key, value):
-                return True
+    Args:
+        app: Instanz der GuiApp
+        widget: Eingabefeld mit field_key und field_type
+        
+    Returns:
+        bool: True, wenn sich der gespeicherte Wert geändert hat
+    """
+    # Wert entsprechend dem Feldtyp extrahieren
+    value = None
+    if widget.field_type == 'text' or widget.field_type == 'folder':
+        value = widget.get()
+    elif widget.field_type == 'dropdown':
+        value = widget.get()
+    elif widget.field_type == 'spinbox':
+        try:
+            value = int(widget.get())
+        except ValueError:
+            try:
+                value = float(widget.get())
+            except ValueError:
+                value = widget.get()
+    elif widget.field_type == 'scale':
+        value = widget.get()
+    elif widget.field_type == 'checkbox':
+        value = widget.var.get()
+        
+    # Übergeordnetes Dict nur einmal pro Konfigurationsobjekt auflösen
+    if getattr(widget, '_config_ref', None) is not app.config:
+        widget._parent_dict, widget._leaf = _resolve_config_parent(app.config, widget._key_parts)
+        widget._config_ref = app.config
+    
+    # Wert in der Konfiguration speichern
+    parent_dict, leaf = widget._parent_dict, widget._leaf
+    if leaf in parent_dict and parent_dict[leaf] == value:
+        return False
+    
+    parent_dict[leaf] = value
+    return True
+
+def _resolve_config_parent(config, key_parts):
+    """
+    Ermittelt das Dict, in dem der letzte Schlüssel eines Pfades liegt
+    
+    Fehlende Zwischenebenen werden als leere Dicts angelegt.
+    
+    Args:
+        config: Die Konfiguration (dict)
+        key_parts: Bereits zerlegter Schlüsselpfad (tuple)
+        
+    Returns:
+        tuple: (übergeordnetes Dict, letzter Schlüssel)
+    """
+    current = config
+    for key in key_parts[:-1]:
+        if key not in current:
+            current[key] = {}
+        current = current[key]
     
-    return False
\ No newline at end of file
+    return current, key_parts[-1]
@@ -4,51 +4,122 @@ Einstellungsdialog für MaehrDocs
 Erstellt ein Fenster zur Konfiguration der Anwendung
 """
 
+import copy
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-import yaml
 from .gui_buttons import create_button
-from .gui_settings_components import create_settings_section, collect_settings_from_widget, search_and_update_field
+from .gui_forms import configure_form_styles
+from .gui_settings_components import (
+    create_settings_section,
+    collect_settings_from_widget,
+    refresh_settings_fields,
+    reset_settings_field_cache
+)
+
+# Felddefinitionen der Einstellungs-Tabs (Schlüssel als bereits zerlegte Pfade)
+GENERAL_FIELDS = [
+    {"label": "Eingangsordner", "key": ("paths", "input_dir"), "type": "folder"},
+    {"label": "Ausgabeordner", "key": ("paths", "output_dir"), "type": "folder"},
+    {"label": "Fehlerordner", "key": ("paths", "trash_dir"), "type": "folder"}
+]
+
+OPENAI_FIELDS = [
+    {"label": "Modell", "key": ("openai", "model"), "type": "dropdown", 
+     "options": ["gpt-3.5-turbo", "gpt-4o", "gpt-4-1106-preview"]},
+    {"label": "Temperatur", "key": ("openai", "temperature"), "type": "scale", 
+     "from": 0, "to": 1, "resolution": 0.1},
+    {"label": "Max. Wiederholungsversuche", "key": ("openai", "max_retries"), 
+     "type": "spinbox", "from": 1, "to": 10}
+]
+
+DOCUMENT_FIELDS = [
+    {"label": "Max. Dateigröße (MB)", "key": ("document_processing", "max_file_size_mb"), 
+     "type": "spinbox", "from": 1, "to": 50},
+    {"label": "Ähnlichkeitsschwelle für Duplikate", "key": ("document_processing", "similarity_threshold"), 
+     "type": "scale", "from": 0.5, "to": 1.0, "resolution": 0.05}
+]
+
+NOTIFICATION_FIELDS = [
+    {"label": "Popup bei Duplikaten anzeigen", "key": ("gui", "show_duplicate_popup"), "type": "checkbox"},
+    {"label": "Benachrichtigung bei Verarbeitungsabschluss", "key": ("gui", "notify_on_completion"), "type": "checkbox"},
+    {"label": "Soundeffekte aktivieren", "key": ("gui", "enable_sounds"), "type": "checkbox"}
+]
 
 def open_settings(app):
     """
     Öffnet das Einstellungsfenster
     
+    Das Fenster wird beim Schließen nur verborgen und beim nächsten Öffnen
+    mit den aktuellen Konfigurationswerten wiederverwendet.
+    
     Args:
         app: Instanz der GuiApp
     """
+    # Konfiguration auffrischen; bei unveränderter Datei ohne erneutes Parsen
+    app.config = app.config_manager.reload_config()
+    
+    # Vorhandenes Fenster wiederverwenden, statt alle Widgets neu zu erstellen
+    cached_window = app._cached_settings_window
+    if cached_window is not None and cached_window.winfo_exists():
+        refresh_settings_fields(app)
+        _load_doctypes(app)
+        cached_window.deiconify()
+        cached_window.lift()
+        return
+    
+    # Farben einmalig nachschlagen; Schriftarten kommen aus den gemeinsamen Stilen
+    bg_dark = app.colors["background_dark"]
+    bg_med = app.colors["background_medium"]
+    configure_form_styles(app)
+    
     settings_window = tk.Toplevel(app.root)
     settings_window.title("MaehrDocs - Einstellungen")
     settings_window.geometry("800x600")
-    settings_window.configure(bg=app.colors["background_dark"])
+    settings_window.configure(bg=bg_dark)
+    settings_window.protocol("WM_DELETE_WINDOW", settings_window.withdraw)
+    app._cached_settings_window = settings_window
+    
+    # Feldregister und -index für dieses Fenster neu aufbauen und beim Zerstören leeren
+    settings_fields = app._settings_fields = []
+    field_index = app._field_index = {}
+    
+    def clear_field_registry(event):
+        if event.widget is settings_window:
+            settings_fields.clear()
+            field_index.clear()
+    
+    settings_window.bind("<Destroy>", clear_field_registry)
     
     # Einstellungen aus der Konfigurationsdatei laden
-    settings_frame = tk.Frame(settings_window, bg=app.colors["background_medium"], padx=20, pady=20)
+    settings_frame = tk.Frame(settings_window, bg=bg_med, padx=20, pady=20)
     settings_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
     
     # Überschrift
-    header = tk.Label(
+    header = ttk.Label(
         settings_frame, 
         text="Einstellungen", 
-        font=app.fonts["header"],
-        fg=app.colors["text_primary"],
-        bg=app.colors["background_medium"]
+        style="Settings.Header.TLabel"
     )
     header.pack(anchor=tk.W, pady=(0, 20))
     
     # Notebook für Einstellungskategorien
     notebook = ttk.Notebook(settings_frame)
     
-    # Einstellungs-Tabs erstellen
+    # Einstellungs-Tabs anlegen; die Inhalte entstehen erst beim ersten Anzeigen
+    app.doctypes_text = None
+    app._doctypes_original = None
     create_general_tab(app, notebook)
     create_openai_tab(app, notebook)
     create_document_tab(app, notebook)
     create_notifications_tab(app, notebook)
     
+    notebook.bind("<<NotebookTabChanged>>", lambda event: _build_selected_tab(app, notebook))
+    _build_selected_tab(app, notebook)
+    
     notebook.pack(fill=tk.BOTH, expand=True)
     
     # Buttons
-    buttons_frame = tk.Frame(settings_frame, bg=app.colors["background_medium"], pady=15)
+    buttons_frame = tk.Frame(settings_frame, bg=bg_med, pady=15)
     buttons_frame.pack(fill=tk.X)
     
     save_btn = create_button(
@@ -63,76 +134,136 @@ def open_settings(app):
         app,
         buttons_frame, 
         "Abbrechen", 
-        settings_window.destroy
+        settings_window.withdraw
     )
     cancel_btn.pack(side=tk.RIGHT, padx=5)
 
+def _add_lazy_tab(app, notebook, title, builder):
+    """
+    Fügt dem Notebook einen leeren Tab hinzu, dessen Inhalt später aufgebaut wird
+    
+    Args:
+        app: Instanz der GuiApp
+        notebook: ttk.Notebook-Widget
+        title: Beschriftung des Tabs
+        builder: Funktion (app, frame), die den Inhalt erstellt
+        
+    Returns:
+        tk.Frame: Der Tab-Frame
+    """
+    tab_frame = tk.Frame(notebook, bg=app.colors["background_medium"])
+    notebook.add(tab_frame, text=title)
+    
+    tab_frame._builder = builder
+    tab_frame._built = False
+    
+    return tab_frame
+
+def _build_selected_tab(app, notebook):
+    """
+    Baut den Inhalt des ausgewählten Tabs auf, falls noch nicht geschehen
+    
+    Args:
+        app: Instanz der GuiApp
+        notebook: ttk.Notebook-Widget
+    """
+    selected = notebook.select()
+    if not selected:
+        return
+    
+    tab_frame = notebook.nametowidget(selected)
+    if not getattr(tab_frame, '_built', True):
+        tab_frame._built = True
+        tab_frame._builder(app, tab_frame)
+
 def create_general_tab(app, notebook):
     """
     Erstellt den Tab für allgemeine Einstellungen
     
+    Der Inhalt wird erst beim ersten Anzeigen des Tabs aufgebaut.
+    
     Args:
         app: Instanz der GuiApp
         notebook: ttk.Notebook-Widget
+        
+    Returns:
+        tk.Frame: Der (zunächst leere) Tab-Frame
     """
-    general_frame = tk.Frame(notebook, bg=app.colors["background_medium"])
-    notebook.add(general_frame, text="Allgemein")
+    return _add_lazy_tab(app, notebook, "Allgemein", _build_general_tab)
+
+def _build_general_tab(app, general_frame):
+    """
+    Baut den Inhalt des Tabs für allgemeine Einstellungen auf
     
+    Args:
+        app: Instanz der GuiApp
+        general_frame: Frame des Tabs
+    """
     # Pfade
-    paths_section = create_settings_section(app, general_frame, "Verzeichnisse", [
-        {"label": "Eingangsordner", "key": "paths.input_dir", "type": "folder"},
-        {"label": "Ausgabeordner", "key": "paths.output_dir", "type": "folder"},
-        {"label": "Fehlerordner", "key": "paths.trash_dir", "type": "folder"}
-    ])
+    paths_section = create_settings_section(app, general_frame, "Verzeichnisse", GENERAL_FIELDS)
 
 def create_openai_tab(app, notebook):
     """
     Erstellt den Tab für OpenAI-Einstellungen
     
+    Der Inhalt wird erst beim ersten Anzeigen des Tabs aufgebaut.
+    
     Args:
         app: Instanz der GuiApp
         notebook: ttk.Notebook-Widget
+        
+    Returns:
+        tk.Frame: Der (zunächst leere) Tab-Frame
     """
-    openai_frame = tk.Frame(notebook, bg=app.colors["background_medium"])
-    notebook.add(openai_frame, text="OpenAI")
+    return _add_lazy_tab(app, notebook, "OpenAI", _build_openai_tab)
+
+def _build_openai_tab(app, openai_frame):
+    """
+    Baut den Inhalt des Tabs für OpenAI-Einstellungen auf
     
-    openai_section = create_settings_section(app, openai_frame, "API-Einstellungen", [
-        {"label": "Modell", "key": "openai.model", "type": "dropdown", 
-         "options": ["gpt-3.5-turbo", "gpt-4o", "gpt-4-1106-preview"]},
-        {"label": "Temperatur", "key": "openai.temperature", "type": "scale", 
-         "from": 0, "to": 1, "resolution": 0.1},
-        {"label": "Max. Wiederholungsversuche", "key": "openai.max_retries", 
-         "type": "spinbox", "from": 1, "to": 10}
-    ])
+    Args:
+        app: Instanz der GuiApp
+        openai_frame: Frame des Tabs
+    """
+    openai_section = create_settings_section(app, openai_frame, "API-Einstellungen", OPENAI_FIELDS)
 
 def create_document_tab(app, notebook):
     """
     Erstellt den Tab für Dokumentverarbeitungseinstellungen
     
+    Der Inhalt wird erst beim ersten Anzeigen des Tabs aufgebaut.
+    
     Args:
         app: Instanz der GuiApp
         notebook: ttk.Notebook-Widget
+        
+    Returns:
+        tk.Frame: Der (zunächst leere) Tab-Frame
+    """
+    return _add_lazy_tab(app, notebook, "Dokumentverarbeitung", _build_document_tab)
+
+def _build_document_tab(app, docs_frame):
     """
-    docs_frame = tk.Frame(notebook, bg=app.colors["background_medium"])
-    notebook.add(docs_frame, text="Dokumentverarbeitung")
+    Baut den Inhalt des Tabs für Dokumentverarbeitungseinstellungen auf
     
-    docs_section = create_settings_section(app, docs_frame, "Verarbeitungsoptionen", [
-        {"label": "Max. Dateigröße (MB)", "key": "document_processing.max_file_size_mb", 
-         "type": "spinbox", "from": 1, "to": 50},
-        {"label": "Ähnlichkeitsschwelle für Duplikate", "key": "document_processing.similarity_threshold", 
-         "type": "scale", "from": 0.5, "to": 1.0, "resolution": 0.05}
-    ])
+    Args:
+        app: Instanz der GuiApp
+        docs_frame: Frame des Tabs
+    """
+    # Farben einmalig nachschlagen
+    bg_med = app.colors["background_medium"]
+    text_fg = app.colors["text_primary"]
+    
+    docs_section = create_settings_section(app, docs_frame, "Verarbeitungsoptionen", DOCUMENT_FIELDS)
     
     # Dokumenttypen
-    doctypes_frame = tk.Frame(docs_frame, bg=app.colors["card_background"], padx=15, pady=15)
+    doctypes_frame = ttk.Frame(docs_frame, style="Settings.Card.TFrame", padding=15)
     doctypes_frame.pack(fill=tk.X, pady=10)
     
-    doctypes_header = tk.Label(
+    doctypes_header = ttk.Label(
         doctypes_frame, 
         text="Gültige Dokumenttypen", 
-        font=app.fonts["subheader"],
-        fg=app.colors["text_primary"],
-        bg=app.colors["card_background"]
+        style="Settings.Subheader.TLabel"
     )
     doctypes_header.pack(anchor=tk.W, pady=(0, 10))
     
@@ -140,38 +271,64 @@ def create_document_tab(app, notebook):
     doctypes_text = tk.Text(
         doctypes_frame, 
         height=5, 
-        bg=app.colors["background_medium"],
-        fg=app.colors["text_primary"],
+        bg=bg_med,
+        fg=text_fg,
         font=app.fonts["normal"]
     )
     doctypes_text.pack(fill=tk.X)
     
-    # Aktuelle Dokumenttypen laden
-    try:
-        doctypes = app.config.get("document_processing", {}).get("valid_doc_types", [])
-        doctypes_text.insert(tk.END, "\n".join(doctypes))
-    except:
-        app.log("Fehler beim Laden der Dokumenttypen", level="error")
-    
-    # Speichern der Referenz auf Dokumenttypen
+    # Speichern der Referenz auf Dokumenttypen und aktuelle Werte laden
     app.doctypes_text = doctypes_text
+    _load_doctypes(app)
+
+def _load_doctypes(app):
+    """
+    Füllt das Textfeld für Dokumenttypen mit den Werten aus der Konfiguration
+    
+    Args:
+        app: Instanz der GuiApp
+    """
+    doctypes_text = getattr(app, 'doctypes_text', None)
+    if doctypes_text is None:
+        return
+    
+    doctypes_text.delete(1.0, tk.END)
+    app._doctypes_original = None
+    
+    doctypes = (app.config.get("document_processing") or {}).get("valid_doc_types") or []
+    if isinstance(doctypes, list):
+        doctypes = [str(doctype) for doctype in doctypes]
+        doctypes_text.insert(tk.END, "\n".join(doctypes))
+        
+        # Ausgangsstand merken, um unveränderte Dokumenttypen beim Speichern zu erkennen
+        app._doctypes_original = doctypes
+    else:
+        app.log("Ungültige Dokumenttypen in der Konfiguration", level="warning")
 
 def create_notifications_tab(app, notebook):
     """
     Erstellt den Tab für Benachrichtigungseinstellungen
     
+    Der Inhalt wird erst beim ersten Anzeigen des Tabs aufgebaut.
+    
     Args:
         app: Instanz der GuiApp
         notebook: ttk.Notebook-Widget
+        
+    Returns:
+        tk.Frame: Der (zunächst leere) Tab-Frame
+    """
+    return _add_lazy_tab(app, notebook, "Benachrichtigungen", _build_notifications_tab)
+
+def _build_notifications_tab(app, notifications_frame):
     """
-    notifications_frame = tk.Frame(notebook, bg=app.colors["background_medium"])
-    notebook.add(notifications_frame, text="Benachrichtigungen")
+    Baut den Inhalt des Tabs für Benachrichtigungseinstellungen auf
     
-    notifications_section = create_settings_section(app, notifications_frame, "Benachrichtigungsoptionen", [
-        {"label": "Popup bei Duplikaten anzeigen", "key": "gui.show_duplicate_popup", "type": "checkbox"},
-        {"label": "Benachrichtigung bei Verarbeitungsabschluss", "key": "gui.notify_on_completion", "type": "checkbox"},
-        {"label": "Soundeffekte aktivieren", "key": "gui.enable_sounds", "type": "checkbox"}
-    ])
+    Args:
+        app: Instanz der GuiApp
+        notifications_frame: Frame des Tabs
+    """
+    notifications_section = create_settings_section(app, notifications_frame, "Benachrichtigungsoptionen", NOTIFICATION_FIELDS)
 
 def save_settings(app, settings_window):
     """
@@ -181,32 +338,52 @@ def save_settings(app, settings_window):
         app: Instanz der GuiApp
         settings_window: Das Einstellungsfenster
     """
+    # Ausgangsstand sichern, um app.config bei einem Fehler zurückzusetzen
+    original_config = copy.deepcopy(app.config)
+    
     try:
-        # Alle Eingabefelder im Fenster finden
-        collect_settings_from_widget(app, settings_window)
+        # Werte aller registrierten Eingabefelder übernehmen
+        changed = collect_settings_from_widget(app)
         
-        # Dokumenttypen speichern
-        if hasattr(app, 'doctypes_text'):
-            doctypes = app.doctypes_text.get(1.0, tk.END).strip().split('\n')
-            if 'document_processing' not in app.config:
-                app.config['document_processing'] = {}
-            app.config['document_processing']['valid_doc_types'] = doctypes
+        # Dokumenttypen speichern (nur wenn der Tab aufgebaut und geändert wurde)
+        if getattr(app, 'doctypes_text', None) is not None:
+            raw = app.doctypes_text.get("1.0", "end-1c")
+            doctypes = [line for line in raw.splitlines() if line.strip()]
+            if doctypes != app._doctypes_original:
+                app.config.setdefault('document_processing', {})['valid_doc_types'] = doctypes
+                changed = True
         
-        # Konfiguration speichern
-        app.config_manager.save_config(app.config)
-        
-        # Dashboard aktualisieren
-        app.update_dashboard()
-        
-        # Fenster schließen
-        settings_window.destroy()
-        
-        # Bestätigung anzeigen
-        messagebox.showinfo("Einstellungen", "Die Einstellungen wurden erfolgreich gespeichert.")
+        # Ohne Änderungen weder YAML serialisieren noch Datei schreiben
+        if not changed:
+            app.log("Einstellungen unverändert, nichts zu speichern")
+            settings_window.withdraw()
+            return
         
+        # Konfiguration speichern; der ConfigManager meldet Fehler über den Rückgabewert
+        if not app.config_manager.save_config(app.config):
+            raise OSError("Konfigurationsdatei konnte nicht geschrieben werden")
+    
     except Exception as e:
+        # Nicht gespeicherte Änderungen verwerfen (app.config bleibt dasselbe Objekt,
+        # die Felder müssen ihre übergeordneten Dicts daher neu auflösen)
+        app.config.clear()
+        app.config.update(original_config)
+        reset_settings_field_cache(app)
         messagebox.showerror("Fehler", f"Fehler beim Speichern der Einstellungen: {str(e)}")
         app.log(f"Fehler beim Speichern der Einstellungen: {str(e)}", level="error")
+        return
+    
+    # Dashboard aktualisieren (Einstellungen sind bereits gespeichert)
+    try:
+        app.update_dashboard()
+    except Exception as e:
+        app.log(f"Fehler beim Aktualisieren des Dashboards: {str(e)}", level="warning")
+    
+    # Fenster verbergen (wird beim nächsten Öffnen wiederverwendet)
+    settings_window.withdraw()
+    
+    # Bestätigung anzeigen
+    messagebox.showinfo("Einstellungen", "Die Einstellungen wurden erfolgreich gespeichert.")
 
 def browse_folder(app, field_key):
     """
@@ -218,11 +395,7 @@ def browse_folder(app, field_key):
     """
     folder = filedialog.askdirectory(title="Ordner auswählen")
     if folder:
-        # Für alle Top-Level-Fenster durchsuchen
-        for widget in app.root.winfo_children():
-            if isinstance(widget, tk.Toplevel):
-                # Für alle Widgets im Fenster
-                for child in widget.winfo_children():
-                    # Rekursiv nach dem Feld suchen
-                    if hasattr(child, 'winfo_children'):
-                        search_and_update_field(child, field_key, folder)
\ No newline at end of file
+        field = app._field_index.get(field_key)
+        if field is not None:
+            field.delete(0, tk.END)
+            field.insert(0, folder)
@@ -8,11 +8,26 @@ interaktiven Elementen.
 import tkinter as tk
 from tkinter import ttk
 import logging
+import sys
+from bisect import bisect_left
+from collections import Counter
 
 # Eigene Module importieren - AKTUALISIERT
-from .gui_statistics_data import collect_data, clear_cache
+from .gui_statistics_data import (
+    collect_data_async,
+    clear_cache,
+    calculate_cutoff_date,
+    aggregate_documents,
+    order_size_counts
+)
 from .gui_charts_manager import ChartManager  # Neuer Import
 
+# Wartezeit in Millisekunden, um schnell aufeinanderfolgende Filterwechsel zusammenzufassen
+FILTER_DEBOUNCE_MS = 150
+
+# Chart-Typen des Panels in der Reihenfolge des 2x2-Rasters
+CHART_TYPES = ("type", "sender", "size", "timeline")
+
 class StatisticsPanel:
     """
     Klasse zur Darstellung von Dokumentenstatistiken.
@@ -55,6 +70,30 @@ class StatisticsPanel:
         self.doc_types = ["Alle Typen"]
         self.senders = ["Alle Absender"]
         
+        # Gesammelte Daten je Zeitraum; Typ- und Absenderfilter benötigen keinen neuen Scan
+        self._data_cache = {}
+        
+        # Spaltenweise Sicht auf die Dokumente je Zeitraum für schnelles Filtern
+        self._column_cache = {}
+        
+        # Alle Dokumente nach Änderungsdatum sortiert (None, solange nicht aufgebaut)
+        self._sorted_docs = None
+        self._sorted_mtimes = None
+        
+        # Stand der Daten (erhöht durch refresh) und laufende Sammelvorgänge
+        self._generation = 0
+        self._pending_scans = set()
+        
+        # Zuletzt in die Dropdowns geschriebene Werte
+        self._last_types = None
+        self._last_senders = None
+        
+        # Zeitraum, Filter und Datenobjekt der zuletzt gezeichneten Charts
+        self._last_signature = None
+        
+        # Geplante, noch nicht ausgeführte Aktualisierung nach Filterwechsel
+        self._pending_update = None
+        
         # UI erstellen
         self._create_ui()
         
@@ -175,40 +214,148 @@ class StatisticsPanel:
         self.charts_frame = tk.Frame(self.frame, bg=self.app.colors["card_background"])
         self.charts_frame.pack(fill=tk.BOTH, expand=True)
         
-        # Grid für Charts (2x2)
-        self.charts_frame.columnconfigure(0, weight=1)
-        self.charts_frame.columnconfigure(1, weight=1)
-        self.charts_frame.rowconfigure(0, weight=1)
-        self.charts_frame.rowconfigure(1, weight=1)
-        
-        # Einzelne Chart-Frames
-        self.type_chart_frame = tk.Frame(self.charts_frame, bg=self.app.colors["background_medium"])
-        self.type_chart_frame.grid(row=0, column=0, padx=5, pady=5, sticky="nsew")
-        
-        self.sender_chart_frame = tk.Frame(self.charts_frame, bg=self.app.colors["background_medium"])
-        self.sender_chart_frame.grid(row=0, column=1, padx=5, pady=5, sticky="nsew")
-        
-        self.size_chart_frame = tk.Frame(self.charts_frame, bg=self.app.colors["background_medium"])
-        self.size_chart_frame.grid(row=1, column=0, padx=5, pady=5, sticky="nsew")
-        
-        self.timeline_chart_frame = tk.Frame(self.charts_frame, bg=self.app.colors["background_medium"])
-        self.timeline_chart_frame.grid(row=1, column=1, padx=5, pady=5, sticky="nsew")
+        # Alle Charts als Achsen einer gemeinsamen Figur (2x2) mit einem Canvas erstellen
+        self.figure, self.canvas = self.chart_manager.create_chart_grid(
+            self.charts_frame,
+            [(f"{chart_type}_chart", chart_type) for chart_type in CHART_TYPES]
+        )
         
-        # Charts mit dem ChartManager erstellen
-        _, self.type_canvas = self.chart_manager.create_chart(self.type_chart_frame, "type_chart", "type")
-        _, self.sender_canvas = self.chart_manager.create_chart(self.sender_chart_frame, "sender_chart", "sender")
-        _, self.size_canvas = self.chart_manager.create_chart(self.size_chart_frame, "size_chart", "size")
-        _, self.timeline_canvas = self.chart_manager.create_chart(self.timeline_chart_frame, "timeline_chart", "timeline")
+        # Bisherige Attribute je Chart (type_figure, type_canvas, ...) verweisen auf die gemeinsame Figur
+        for chart_type in CHART_TYPES:
+            setattr(self, f"{chart_type}_figure", self.figure)
+            setattr(self, f"{chart_type}_canvas", self.canvas)
     
     def _on_filter_change(self):
-        """Wird aufgerufen, wenn sich ein Filter ändert."""
+        """
+        Wird aufgerufen, wenn sich ein Filter ändert.
+        
+        Mehrere Änderungen innerhalb von FILTER_DEBOUNCE_MS werden zu einer
+        einzigen Aktualisierung der Charts zusammengefasst.
+        """
+        if self._pending_update is not None:
+            self.frame.after_cancel(self._pending_update)
+        self._pending_update = self.frame.after(FILTER_DEBOUNCE_MS, self._do_update)
+    
+    def _do_update(self):
+        """Führt die verzögerte Aktualisierung nach einem Filterwechsel aus."""
+        self._pending_update = None
         self.update_charts()
     
     def _reset_filters(self):
-        """Setzt alle Filter auf die Standardwerte zurück."""
+        """Setzt alle Filter auf die Standardwerte zurück und lädt die Daten neu."""
         self.selected_period.set(self.time_periods[0])
         self.selected_type.set("Alle Typen")
         self.selected_sender.set("Alle Absender")
+        self.refresh()
+    
+    def refresh(self):
+        """Verwirft alle zwischengespeicherten Daten und aktualisiert die Charts."""
+        # Ergebnisse noch laufender Sammelvorgänge verwerfen
+        self._generation += 1
+        self._pending_scans.clear()
+        
+        self._data_cache.clear()
+        self._column_cache.clear()
+        self._sorted_docs = None
+        self._sorted_mtimes = None
+        self._last_signature = None
+        clear_cache()
+        self.update_charts()
+    
+    def _get_data(self, period):
+        """
+        Liefert die Dokumentendaten für einen Zeitraum aus dem Panel-Cache.
+        
+        Args:
+            period: Zeitraum für die Filterung ("Alle", "Heute", usw.)
+            
+        Returns:
+            dict: Gesammelte Dokumentendaten oder None, wenn die Daten erst
+                im Hintergrund gesammelt werden
+        """
+        data = self._data_cache.get(period)
+        if data is None:
+            data = self._collect_period(period)
+            if data is not None:
+                self._data_cache[period] = data
+        return data
+    
+    def _collect_period(self, period):
+        """
+        Ermittelt die Daten für einen Zeitraum ohne Dateisystemzugriff.
+        
+        Ist die Gesamtliste aller Dokumente vollständig, wird ein Zeitraum per bisect
+        aus der nach Datum sortierten Liste geschnitten, statt die Ordner
+        erneut zu durchsuchen. Andernfalls wird ein Sammelvorgang im
+        Hintergrund gestartet.
+        
+        Args:
+            period: Zeitraum für die Filterung ("Alle", "Heute", usw.)
+            
+        Returns:
+            dict: Gesammelte Dokumentendaten oder None, solange gesammelt wird
+        """
+        cutoff = calculate_cutoff_date(period)
+        if cutoff is None:
+            return self._start_scan(period)
+        
+        if self._sorted_docs is None:
+            all_data = self._data_cache.get("Alle")
+            if all_data is None:
+                return self._start_scan("Alle")
+            
+            # Nur wenn die Dokumentliste vollständig ist (nicht gekürzt), lässt sie sich schneiden
+            if len(all_data["documents"]) != sum(all_data["types"].values()):
+                return self._start_scan(period)
+            
+            self._sorted_docs = sorted(all_data["documents"], key=lambda doc: doc["mtime"])
+            # Zeitstempel statt datetime-Objekten, damit bisect nur Zahlen vergleicht
+            self._sorted_mtimes = [doc["mtime"].timestamp() for doc in self._sorted_docs]
+        
+        start = bisect_left(self._sorted_mtimes, cutoff.timestamp())
+        return aggregate_documents(self._sorted_docs[start:])
+    
+    def _start_scan(self, period):
+        """
+        Startet collect_data für einen Zeitraum im Hintergrund-Worker.
+        
+        Das Ergebnis wird über after() im GUI-Thread übernommen.
+        
+        Args:
+            period: Zeitraum für die Filterung ("Alle", "Heute", usw.)
+            
+        Returns:
+            None: Die Daten stehen erst nach Abschluss des Sammelvorgangs bereit
+        """
+        if period in self._pending_scans:
+            return None
+        
+        self._pending_scans.add(period)
+        generation = self._generation
+        collect_data_async(
+            self.app, period,
+            lambda data: self._on_data_ready(generation, period, data)
+        )
+        return None
+    
+    def _on_data_ready(self, generation, period, data):
+        """
+        Übernimmt die im Hintergrund gesammelten Daten und aktualisiert die Charts.
+        
+        Args:
+            generation: Stand von refresh() beim Start des Sammelvorgangs
+            period: Gesammelter Zeitraum
+            data: Gesammelte Dokumentendaten oder None bei einem Fehler
+        """
+        # Veraltete Ergebnisse (vor einem refresh gestartet) ignorieren
+        if generation != self._generation:
+            return
+        
+        self._pending_scans.discard(period)
+        if data is None:
+            return
+        
+        self._data_cache[period] = data
         self.update_charts()
     
     def _update_filter_options(self, data):
@@ -220,39 +367,48 @@ class StatisticsPanel:
             data: Die gesammelten Dokumentendaten
         """
         # Dokumenttypen für das Dropdown sammeln
-        types = ["Alle Typen"]
-        types.extend(sorted(data["types"].keys()))
+        types = ("Alle Typen",) + tuple(sorted(data["types"]))
         
         # Absender für das Dropdown sammeln
-        senders = ["Alle Absender"]
-        senders.extend(sorted(data["senders"].keys()))
-        
-        # Werte im Dropdown aktualisieren, ohne die aktuelle Auswahl zu verlieren
-        current_type = self.selected_type.get()
-        self.type_dropdown['values'] = types
-        if current_type not in types:
-            self.selected_type.set("Alle Typen")
-        
-        current_sender = self.selected_sender.get()
-        self.sender_dropdown['values'] = senders
-        if current_sender not in senders:
-            self.selected_sender.set("Alle Absender")
+        senders = ("Alle Absender",) + tuple(sorted(data["senders"]))
+        
+        # Werte im Dropdown nur bei Änderungen setzen, ohne die aktuelle Auswahl zu verlieren
+        if types != self._last_types:
+            self.type_dropdown['values'] = types
+            self._last_types = types
+            if self.selected_type.get() not in types:
+                self.selected_type.set("Alle Typen")
+        
+        if senders != self._last_senders:
+            self.sender_dropdown['values'] = senders
+            self._last_senders = senders
+            if self.selected_sender.get() not in senders:
+                self.selected_sender.set("Alle Absender")
     
     def update_charts(self):
         """Aktualisiert alle Charts mit aktuellen Daten und angewandten Filtern."""
         try:
             # Daten sammeln für den ausgewählten Zeitraum
             period = self.selected_period.get()
-            data = collect_data(self.app, period)
+            data = self._get_data(period)
+            if data is None:
+                # Charts werden aktualisiert, sobald die Daten gesammelt sind
+                return
             
             # Filter-Dropdown-Optionen aktualisieren
             self._update_filter_options(data)
             
+            # Unveränderte Filter auf denselben Daten nicht erneut zeichnen
+            signature = (period, self.selected_type.get(), self.selected_sender.get(), id(data))
+            if signature == self._last_signature:
+                return
+            
             # Zusätzliche Filter anwenden
-            filtered_data = self._apply_filters(data)
+            filtered_data = self._apply_filters(data, period)
             
             # Alle Charts über den ChartManager aktualisieren
             self.chart_manager.update_all_charts(filtered_data)
+            self._last_signature = signature
             
             # Log generieren
             filter_info = f"Zeitraum: {period}"
@@ -266,12 +422,44 @@ class StatisticsPanel:
         except Exception as e:
             self.logger.error(f"Fehler bei der Aktualisierung der Statistiken: {str(e)}")
     
-    def _apply_filters(self, data):
+    def _get_columns(self, data, period):
+        """
+        Liefert die Dokumentmerkmale spaltenweise als Tupel.
+        
+        Die Spalten werden einmal pro Zeitraum aufgebaut, sodass Filterwechsel
+        nur noch über zusammenhängende Tupel laufen und Größenkategorie sowie
+        Datumsschlüssel nicht erneut berechnet werden.
+        
+        Args:
+            data: Die gesammelten Dokumentendaten
+            period: Zeitraum, zu dem die Daten gehören
+            
+        Returns:
+            dict: Spalten "type", "sender", "size_category" und "date" sowie
+                die Zeilenindizes je Wert in "type_rows" und "sender_rows"
+        """
+        columns = self._column_cache.get(period)
+        if columns is None:
+            documents = data["documents"]
+            columns = self._column_cache[period] = {
+                "type": tuple(doc["type"] for doc in documents),
+                "sender": tuple(doc["sender"] for doc in documents),
+                "size_category": tuple(doc["size_category"] for doc in documents),
+                "date": tuple(doc["date_key"] for doc in documents)
+            }
+            
+            # Zeilenindizes je Typ und Absender, damit Filter nur noch nachschlagen
+            columns["type_rows"] = _index_rows(columns["type"])
+            columns["sender_rows"] = _index_rows(columns["sender"])
+        return columns
+    
+    def _apply_filters(self, data, period=None):
         """
         Wendet die ausgewählten Filter auf die Daten an.
         
         Args:
             data: Die ursprünglichen Dokumentendaten
+            period: Zeitraum der Daten (Schlüssel für die Spalten-Sicht)
             
         Returns:
             dict: Die gefilterten Daten
@@ -281,66 +469,66 @@ class StatisticsPanel:
             self.selected_sender.get() == "Alle Absender"):
             return data
         
-        # Tiefe Kopie der Datenstruktur erstellen für die Filterung
-        filtered_data = {
-            "types": {},
-            "senders": {},
-            "sizes": {},
-            "timeline": {},
-            "documents": []
-        }
+        # Filter anwenden (interniert wie die gesammelten Typen und Absender)
+        selected_type = sys.intern(self.selected_type.get())
+        selected_sender = sys.intern(self.selected_sender.get())
         
-        # Filter anwenden
-        selected_type = self.selected_type.get()
-        selected_sender = self.selected_sender.get()
+        if period is None:
+            period = self.selected_period.get()
+        columns = self._get_columns(data, period)
+        
+        # Indizes der Dokumente bestimmen, die beide Filter bestehen
+        if selected_type != "Alle Typen":
+            rows = columns["type_rows"].get(selected_type, ())
+            if selected_sender != "Alle Absender":
+                sender_rows = set(columns["sender_rows"].get(selected_sender, ()))
+                rows = [index for index in rows if index in sender_rows]
+        else:
+            rows = columns["sender_rows"].get(selected_sender, ())
+        
+        # Statistiken je Spalte über Counter zählen
+        types, senders = columns["type"], columns["sender"]
+        sizes, dates = columns["size_category"], columns["date"]
+        documents = data["documents"]
+        
+        # Bei nur einem aktiven Filter ist dessen Zählung die Anzahl der Zeilen; wie die
+        # übrigen Charts aus den Dokumenten abgeleitet (data["types"] zählt auch
+        # Dateien jenseits der gekürzten Dokumentliste)
+        if selected_type != "Alle Typen" and selected_sender == "Alle Absender":
+            type_counts = {selected_type: len(rows)} if rows else {}
+        else:
+            type_counts = dict(Counter(types[index] for index in rows))
+        
+        if selected_sender != "Alle Absender" and selected_type == "Alle Typen":
+            sender_counts = {selected_sender: len(rows)} if rows else {}
+        else:
+            sender_counts = dict(Counter(senders[index] for index in rows))
         
-        # Dokumente filtern
-        for doc in data["documents"]:
-            # Typ-Filter anwenden
-            if selected_type != "Alle Typen" and doc["type"] != selected_type:
-                continue
-                
-            # Absender-Filter anwenden
-            if selected_sender != "Alle Absender" and doc["sender"] != selected_sender:
-                continue
-                
-            # Dokument aufnehmen, da es die Filter besteht
-            filtered_data["documents"].append(doc)
-            
-            # Statistik-Akkumulatoren aktualisieren
-            # Typ zählen
-            if doc["type"] in filtered_data["types"]:
-                filtered_data["types"][doc["type"]] += 1
-            else:
-                filtered_data["types"][doc["type"]] = 1
-            
-            # Absender zählen
-            if doc["sender"] in filtered_data["senders"]:
-                filtered_data["senders"][doc["sender"]] += 1
-            else:
-                filtered_data["senders"][doc["sender"]] = 1
-            
-            # Größe kategorisieren und zählen
-            size_category = doc.get("size_category", "")
-            if not size_category:
-                from .gui_statistics_data import categorize_size
-                size_category = categorize_size(doc["size"])
-                
-            if size_category in filtered_data["sizes"]:
-                filtered_data["sizes"][size_category] += 1
-            else:
-                filtered_data["sizes"][size_category] = 1
-            
-            # Datum für Zeitverlauf
-            if hasattr(doc["mtime"], "strftime"):
-                date_key = doc["mtime"].strftime("%Y-%m-%d")
-                if date_key in filtered_data["timeline"]:
-                    filtered_data["timeline"][date_key] += 1
-                else:
-                    filtered_data["timeline"][date_key] = 1
+        filtered_data = {
+            "types": type_counts,
+            "senders": sender_counts,
+            "sizes": order_size_counts(Counter(sizes[index] for index in rows)),
+            "timeline": dict(Counter(dates[index] for index in rows)),
+            "documents": [documents[index] for index in rows]
+        }
         
         return filtered_data
 
+def _index_rows(column):
+    """
+    Ordnet jedem Wert einer Spalte die Indizes der Zeilen zu, in denen er vorkommt.
+    
+    Args:
+        column: Spaltenwerte (tuple)
+        
+    Returns:
+        dict: {Wert: Liste der Zeilenindizes in aufsteigender Reihenfolge}
+    """
+    rows = {}
+    for index, value in enumerate(column):
+        rows.setdefault(value, []).append(index)
+    return rows
+
 def create_statistics_panel(app, parent_frame):
     """
     Erstellt ein Statistik-Panel im Dashboard.
@@ -353,17 +541,21 @@ def create_statistics_panel(app, parent_frame):
         dict: Dictionary mit allen erstellten Statistik-Elementen
     """
     try:
+        # Cache leeren, bevor das Panel seine ersten Daten sammelt
+        clear_cache()
+        
         # Statistik-Panel erstellen
         stats_panel = StatisticsPanel(app, parent_frame)
         
-        # Cache leeren, falls vorhanden
-        clear_cache()
-        
-        # Elemente zurückgeben
-        return {
+        # Elemente zurückgeben (inkl. der bisherigen Schlüssel type_figure, type_canvas, ...)
+        elements = {
             "stats_frame": stats_panel.frame,
             "stats_panel": stats_panel
         }
+        for chart_type in CHART_TYPES:
+            elements[f"{chart_type}_figure"] = stats_panel.figure
+            elements[f"{chart_type}_canvas"] = stats_panel.canvas
+        return elements
     except Exception as e:
         app.logger.error(f"Fehler beim Erstellen des Statistik-Panels: {str(e)}")
         
@@ -5,16 +5,56 @@ für die statistische Auswertung mit Caching-Mechanismus für bessere Performanc
 """
 
 import os
+import sys
 import logging
+import queue
+import threading
 import time
+from bisect import bisect_right
+from concurrent.futures import Future, ThreadPoolExecutor
+from collections import Counter, OrderedDict, namedtuple
 from datetime import datetime, timedelta
 from functools import lru_cache
 
-# Cache für die gesammelten Daten
-# Format: {Zeitraum: (Zeitstempel, Daten)}
-_data_cache = {}
-# Maximale Cache-Lebensdauer in Sekunden (5 Minuten)
+# Cache für die gesammelten Daten (zuletzt verwendete Einträge am Ende)
+# Format: {Zeitraum: (Zeitstempel von time.monotonic(), Ordnerzustand, Daten)}
+_data_cache = OrderedDict()
+# Maximale Cache-Lebensdauer in Sekunden (5 Minuten); Änderungen im Ordner
+# werden unabhängig davon über dessen Änderungszeit erkannt
 _CACHE_TTL = 300
+# Maximale Anzahl zwischengespeicherter Zeiträume
+_CACHE_MAX_ENTRIES = 16
+
+# Zeitspanne, für die der Datumsschlüssel eines Zeitstempels wiederverwendet wird;
+# Zeitzonen-Offsets und Zeitumstellungen liegen auf Viertelstunden
+DATE_KEY_BUCKET_SECONDS = 900
+
+# Ab dieser Dateianzahl werden die stat()-Aufrufe parallel vorab ausgeführt
+# (lohnt sich bei langsamen Speichern wie Netzlaufwerken)
+PARALLEL_STAT_THRESHOLD = 500
+# Anzahl der Threads und Einträge pro Auftrag für die parallelen stat()-Aufrufe
+PARALLEL_STAT_WORKERS = 8
+PARALLEL_STAT_BATCH_SIZE = 64
+
+# Aufträge für collect_data_async; ein einzelner Daemon-Thread arbeitet sie nacheinander
+# ab, damit Scans sich den Datencache nicht teilen und das Beenden nicht aufhalten
+_scan_jobs = queue.Queue()
+_scan_worker = None
+# Abgeschlossene Aufträge (Callback, Future), die der GUI-Thread per after() abholt
+_scan_results = queue.Queue()
+# Noch nicht abgeholte Aufträge und geplante Abfrage (nur im GUI-Thread verwendet)
+_pending_scans = set()
+_scan_poll_id = None
+# Abfrageintervall in Millisekunden, solange Aufträge ausstehen
+SCAN_POLL_MS = 100
+
+# Aus dem Dateinamen gelesene Dokumentinformationen (unveränderlich, da gecacht)
+DocumentInfo = namedtuple("DocumentInfo", "type sender date subject")
+
+# Größenkategorien in Anzeigereihenfolge (siehe categorize_size)
+SIZE_CATEGORIES = ("<0.5 MB", "0.5-1 MB", "1-5 MB", ">5 MB")
+# Obergrenzen der Größenkategorien in Bytes (0,5 MB, 1 MB, 5 MB)
+SIZE_BOUNDS = (512 * 1024, 1024 * 1024, 5 * 1024 * 1024)
 
 def collect_data(app, period="Alle"):
     """
@@ -33,15 +73,36 @@ def collect_data(app, period="Alle"):
     """
     logger = logging.getLogger(__name__)
     
-    # Cache-Prüfung
-    current_time = time.time()
-    if period in _data_cache:
-        cache_time, cached_data = _data_cache[period]
-        # Cache verwenden, wenn er noch nicht abgelaufen ist
-        if current_time - cache_time < _CACHE_TTL:
+    # Ordnerpfade aus der Konfiguration
+    output_dir = app.config.get("paths", {}).get("output_dir", "")
+    
+    # Ordnerzustand ermitteln: Hinzufügen, Entfernen und Umbenennen von
+    # Dokumenten ändert die Änderungszeit des Ordners
+    try:
+        dir_state = (output_dir, os.stat(output_dir).st_mtime_ns)
+    except OSError:
+        dir_state = None
+    
+    # Cache-Prüfung (monotone Uhr, unabhängig von Änderungen der Systemzeit)
+    current_time = time.monotonic()
+    cached = _data_cache.get(period)
+    if cached is not None:
+        cache_time, cached_state, cached_data = cached
+        # Cache verwenden, solange der Ordner unverändert und der Eintrag nicht abgelaufen ist
+        if cached_state == dir_state and current_time - cache_time < _CACHE_TTL:
             logger.debug(f"Verwende Cache-Daten für Zeitraum: {period}")
+            try:
+                _data_cache.move_to_end(period)
+            except KeyError:
+                # Cache wurde zwischenzeitlich (aus einem anderen Thread) geleert
+                pass
             return cached_data
     
+    # Abgelaufene Einträge bei jedem Fehlzugriff entfernen
+    for cached_period, (cache_time, _, _) in list(_data_cache.items()):
+        if current_time - cache_time >= _CACHE_TTL:
+            _data_cache.pop(cached_period, None)
+    
     logger.debug(f"Sammle neue Daten für Zeitraum: {period}")
     
     # Dokumentendaten sammeln
@@ -53,82 +114,100 @@ def collect_data(app, period="Alle"):
         "documents": []     # Liste aller gefundenen Dokumente
     }
     
-    # Ordnerpfade aus der Konfiguration
-    output_dir = app.config.get("paths", {}).get("output_dir", "")
-    
-    if not os.path.exists(output_dir):
+    if dir_state is None:
         return data
         
-    # Zeitraumfilter berechnen
+    # Zeitraumfilter berechnen (als Zeitstempel, um direkt mit st_mtime zu vergleichen)
     cutoff_date = calculate_cutoff_date(period)
+    cutoff_timestamp = cutoff_date.timestamp() if cutoff_date else None
     
     try:
-        # Optimierung: Vorfilterung der Dateiliste
+        # Optimierung: Vorfilterung der Dateiliste; DirEntry liefert Pfad und
+        # (unter Windows bereits zwischengespeicherte) Stat-Daten
         start_time = time.time()
-        pdf_files = [f for f in os.listdir(output_dir) if f.lower().endswith('.pdf')]
+        with os.scandir(output_dir) as entries:
+            pdf_files = [entry for entry in entries if entry.name.lower().endswith('.pdf')]
+        
+        # Bei vielen Dateien die Wartezeiten der stat()-Aufrufe überlappen lassen
+        if len(pdf_files) > PARALLEL_STAT_THRESHOLD:
+            prefetch_stats(pdf_files)
+        
+        # Zähler mit nur einem Hash-Zugriff pro Erhöhung
+        type_counts = Counter()
+        sender_counts = Counter()
+        size_counts = Counter()
+        timeline_counts = Counter()
+        
+        # Datumsschlüssel je Viertelstunde, statt für jede Datei strftime aufzurufen
+        date_keys = {}
         
         # Mit Generator arbeiten für bessere Speichereffizienz
-        for filename in pdf_files:
-            file_path = os.path.join(output_dir, filename)
+        for entry in pdf_files:
+            filename = entry.name
+            file_path = entry.path
             
             try:
-                file_stat = os.stat(file_path)
-                file_size = file_stat.st_size / (1024 * 1024)  # Größe in MB
-                file_mtime = datetime.fromtimestamp(file_stat.st_mtime)
+                file_stat = entry.stat()
                 
-                # Zeitraumfilter anwenden
-                if cutoff_date and file_mtime < cutoff_date:
+                # Zeitraumfilter anwenden, bevor datetime-Objekte erzeugt werden
+                if cutoff_timestamp is not None and file_stat.st_mtime < cutoff_timestamp:
                     continue
                 
                 # Dokumentinformationen extrahieren
                 doc_info = extract_document_info(filename)
                 
-                # Dokumenttyp zählen
-                if doc_info["type"] in data["types"]:
-                    data["types"][doc_info["type"]] += 1
-                else:
-                    data["types"][doc_info["type"]] = 1
+                # Typ und Absender internieren, damit gleiche Werte dasselbe
+                # Objekt teilen (schnellere Vergleiche und Dict-Zugriffe)
+                doc_type = sys.intern(doc_info.type)
+                doc_sender = sys.intern(doc_info.sender)
                 
-                # Absender zählen
-                if doc_info["sender"] in data["senders"]:
-                    data["senders"][doc_info["sender"]] += 1
-                else:
-                    data["senders"][doc_info["sender"]] = 1
+                # Dokumenttyp und Absender zählen
+                type_counts[doc_type] += 1
+                sender_counts[doc_sender] += 1
                 
                 # Größenkategorie bestimmen und zählen
-                size_category = categorize_size(file_size)
-                if size_category in data["sizes"]:
-                    data["sizes"][size_category] += 1
-                else:
-                    data["sizes"][size_category] = 1
+                size_category = categorize_size(file_stat.st_size)
+                size_counts[size_category] += 1
                 
-                # Datum für Zeitverlauf extrahieren und zählen
-                date_key = file_mtime.strftime("%Y-%m-%d")
-                if date_key in data["timeline"]:
-                    data["timeline"][date_key] += 1
-                else:
-                    data["timeline"][date_key] = 1
+                # Datum für Zeitverlauf bestimmen (innerhalb einer Viertelstunde konstant) und zählen
+                bucket = int(file_stat.st_mtime // DATE_KEY_BUCKET_SECONDS)
+                date_key = date_keys.get(bucket)
+                if date_key is None:
+                    bucket_start = datetime.fromtimestamp(bucket * DATE_KEY_BUCKET_SECONDS)
+                    date_key = date_keys[bucket] = bucket_start.strftime("%Y-%m-%d")
+                timeline_counts[date_key] += 1
                 
                 # Dokument zur Liste hinzufügen - nur bei Bedarf die vollständigen Daten
                 if len(data["documents"]) < 1000:  # Begrenzung für Speichereffizienz
                     data["documents"].append({
                         "filename": filename,
                         "path": file_path,
-                        "size": file_size,
-                        "mtime": file_mtime,
-                        "type": doc_info["type"],
-                        "sender": doc_info["sender"]
+                        "size": file_stat.st_size / (1024 * 1024),  # Größe in MB
+                        "mtime": datetime.fromtimestamp(file_stat.st_mtime),
+                        "date_key": date_key,
+                        "type": doc_type,
+                        "sender": doc_sender,
+                        "size_category": size_category
                     })
             except Exception as e:
                 logger.warning(f"Fehler bei Verarbeitung von {filename}: {str(e)}")
                 continue
+        
+        # Zählerstände als normale Dicts übernehmen
+        data["types"] = dict(type_counts)
+        data["senders"] = dict(sender_counts)
+        data["sizes"] = order_size_counts(size_counts)
+        data["timeline"] = dict(timeline_counts)
                 
         # Verarbeitungszeit messen
         processing_time = time.time() - start_time
         logger.debug(f"Datensammlung für {len(pdf_files)} Dateien: {processing_time:.2f} Sekunden")
         
-        # Daten im Cache speichern
-        _data_cache[period] = (current_time, data)
+        # Daten im Cache speichern; älteste Zeiträume verdrängen
+        _data_cache[period] = (current_time, dir_state, data)
+        _data_cache.move_to_end(period)
+        while len(_data_cache) > _CACHE_MAX_ENTRIES:
+            _data_cache.popitem(last=False)
         
         return data
         
@@ -136,6 +215,125 @@ def collect_data(app, period="Alle"):
         logger.error(f"Fehler bei der Datensammlung: {str(e)}")
         return data
 
+def collect_data_async(app, period, callback):
+    """
+    Führt collect_data im Hintergrund aus, ohne die Tk-Ereignisschleife zu blockieren.
+    
+    Muss im GUI-Thread aufgerufen werden. Das Ergebnis wird über eine Queue
+    übergeben, die der GUI-Thread per after() abfragt; der Callback läuft
+    daher ebenfalls im GUI-Thread.
+    
+    Args:
+        app: Die Hauptanwendung (GuiApp-Instanz)
+        period: Zeitraum für die Filterung ("Alle", "Heute", usw.)
+        callback: Funktion, die die gesammelten Daten erhält (None bei einem Fehler)
+        
+    Returns:
+        Future: Future des Sammelvorgangs
+    """
+    global _scan_worker, _scan_poll_id
+    
+    if _scan_worker is None:
+        _scan_worker = threading.Thread(target=_run_scan_jobs, name="statistics", daemon=True)
+        _scan_worker.start()
+        
+        # Beim Schließen des Hauptfensters ausstehende Aufträge verwerfen
+        def on_destroy(event):
+            if event.widget is app.root:
+                _cancel_pending_scans()
+        app.root.bind("<Destroy>", on_destroy, add="+")
+    
+    future = Future()
+    _pending_scans.add(future)
+    _scan_jobs.put((app, period, future, callback))
+    
+    if _scan_poll_id is None:
+        _scan_poll_id = app.root.after(SCAN_POLL_MS, _poll_scan_results, app)
+    return future
+
+def _run_scan_jobs():
+    """
+    Arbeitet die Aufträge von collect_data_async im Hintergrund-Thread ab.
+    
+    Berührt keine Tk-Objekte; Ergebnisse gehen ausschließlich in _scan_results.
+    """
+    while True:
+        app, period, future, callback = _scan_jobs.get()
+        if future.set_running_or_notify_cancel():
+            try:
+                future.set_result(collect_data(app, period))
+            except Exception as e:
+                future.set_exception(e)
+        _scan_results.put((callback, future))
+
+def _poll_scan_results(app):
+    """
+    Holt abgeschlossene Aufträge im GUI-Thread ab und ruft deren Callbacks auf.
+    
+    Plant sich erneut ein, solange noch Aufträge ausstehen.
+    
+    Args:
+        app: Die Hauptanwendung (GuiApp-Instanz)
+    """
+    global _scan_poll_id
+    _scan_poll_id = None
+    logger = logging.getLogger(__name__)
+    
+    while True:
+        try:
+            callback, future = _scan_results.get_nowait()
+        except queue.Empty:
+            break
+        
+        _pending_scans.discard(future)
+        if future.cancelled():
+            continue
+        
+        try:
+            data = future.result()
+        except Exception as e:
+            logger.error(f"Fehler bei der Datensammlung: {str(e)}")
+            data = None
+        
+        try:
+            callback(data)
+        except Exception as e:
+            logger.error(f"Fehler bei der Übernahme der Statistikdaten: {str(e)}")
+    
+    if _pending_scans:
+        _scan_poll_id = app.root.after(SCAN_POLL_MS, _poll_scan_results, app)
+
+def _cancel_pending_scans():
+    """
+    Verwirft alle noch nicht gestarteten Aufträge, z.B. beim Schließen des Fensters.
+    
+    Ein bereits laufender Scan endet im Daemon-Thread und hält das Beenden nicht auf.
+    """
+    global _scan_poll_id
+    
+    for future in _pending_scans:
+        future.cancel()
+    _pending_scans.clear()
+    _scan_poll_id = None
+
+def aggregate_documents(documents):
+    """
+    Erstellt die Statistikstruktur aus einer Liste bereits gesammelter Dokumente.
+    
+    Args:
+        documents: Dokumenteinträge wie von collect_data geliefert
+        
+    Returns:
+        dict: Dokumentendaten im Format von collect_data
+    """
+    return {
+        "types": dict(Counter(doc["type"] for doc in documents)),
+        "senders": dict(Counter(doc["sender"] for doc in documents)),
+        "sizes": order_size_counts(Counter(doc["size_category"] for doc in documents)),
+        "timeline": dict(Counter(doc["date_key"] for doc in documents)),
+        "documents": list(documents)
+    }
+
 # Caching für die Cutoff-Daten-Berechnung
 @lru_cache(maxsize=32)
 def calculate_cutoff_date(period):
@@ -162,6 +360,8 @@ def calculate_cutoff_date(period):
         return datetime.now().replace(month=1, day=1, hour=0, minute=0, second=0, microsecond=0)
     return None
 
+# Caching der Dateinamen, da dieselben Dateien bei jedem Scan erneut auftauchen
+@lru_cache(maxsize=4096)
 def extract_document_info(filename):
     """
     Extrahiert Informationen aus dem Dateinamen eines verarbeiteten Dokuments.
@@ -170,64 +370,80 @@ def extract_document_info(filename):
         filename: Name der Dokumentdatei
         
     Returns:
-        dict: Extrahierte Dokumentinformationen
-    """
-    # Standard-Informationen
-    doc_info = {
-        "type": "Unbekannt",
-        "sender": "Unbekannt",
-        "date": None,
-        "subject": "Unbekannt"
-    }
-    
-    # Format ist typischerweise YYYY-MM-DD_Typ_Absender_Betreff.pdf
-    parts = filename.split("_")
+        DocumentInfo: Extrahierte Dokumentinformationen
+    """
+    # Format ist typischerweise YYYY-MM-DD_Typ_Absender_Betreff.pdf;
+    # Endung einmal entfernen und höchstens in vier Teile zerlegen
+    if filename[-4:].lower() == ".pdf":
+        filename = filename[:-4]
+    parts = filename.split("_", 3)
     
     # Datum (wenn vorhanden)
-    if len(parts) > 0:
-        date_part = parts[0]
-        if len(date_part) == 10 and date_part.count("-") == 2:
-            doc_info["date"] = date_part
-    
-    # Typ (wenn vorhanden)
-    if len(parts) > 1:
-        doc_type = parts[1]
-        if doc_type.lower().endswith('.pdf'):
-            doc_type = doc_type[:-4]
-        doc_info["type"] = doc_type
-    
-    # Absender (wenn vorhanden)
-    if len(parts) > 2:
-        doc_info["sender"] = parts[2]
-    
-    # Betreff (wenn vorhanden)
-    if len(parts) > 3:
-        subject_parts = parts[3:]
-        subject = "_".join(subject_parts)
-        if subject.lower().endswith('.pdf'):
-            subject = subject[:-4]
-        doc_info["subject"] = subject
-    
-    return doc_info
+    date_part = parts[0]
+    if len(date_part) == 10 and date_part.count("-") == 2:
+        date = date_part
+    else:
+        date = None
+    
+    # Fehlende Teile als unbekannt kennzeichnen
+    parts.extend(("Unbekannt",) * (4 - len(parts)))
+    
+    return DocumentInfo(
+        type=parts[1],
+        sender=parts[2],
+        date=date,
+        subject=parts[3]
+    )
 
 def categorize_size(file_size):
     """
     Kategorisiert eine Dateigröße in eine Größenkategorie.
     
     Args:
-        file_size: Dateigröße in MB
+        file_size: Dateigröße in Bytes
         
     Returns:
         str: Größenkategorie
     """
-    if file_size < 0.5:
-        return "<0.5 MB"
-    elif file_size < 1:
-        return "0.5-1 MB"
-    elif file_size < 5:
-        return "1-5 MB"
-    else:
-        return ">5 MB"
+    return SIZE_CATEGORIES[bisect_right(SIZE_BOUNDS, file_size)]
+
+def prefetch_stats(entries):
+    """
+    Ruft stat() für Verzeichniseinträge parallel in einem Thread-Pool auf.
+    
+    DirEntry speichert das Ergebnis zwischen, sodass spätere entry.stat()-Aufrufe
+    nicht mehr auf das Dateisystem warten. Fehler werden hier ignoriert und treten
+    beim späteren Aufruf erneut auf.
+    
+    Args:
+        entries: Liste von os.DirEntry-Objekten
+    """
+    def stat_batch(batch):
+        for entry in batch:
+            try:
+                entry.stat()
+            except OSError:
+                pass
+    
+    batches = [
+        entries[i:i + PARALLEL_STAT_BATCH_SIZE]
+        for i in range(0, len(entries), PARALLEL_STAT_BATCH_SIZE)
+    ]
+    with ThreadPoolExecutor(max_workers=PARALLEL_STAT_WORKERS) as executor:
+        # Ergebnisse abholen, damit Ausnahmen in den Threads nicht verloren gehen
+        list(executor.map(stat_batch, batches))
+
+def order_size_counts(size_counts):
+    """
+    Bringt die Anzahlen je Größenkategorie in die feste Anzeigereihenfolge.
+    
+    Args:
+        size_counts: Anzahlen je Größenkategorie (fehlende Kategorien zählen 0)
+        
+    Returns:
+        dict: Alle Kategorien aus SIZE_CATEGORIES in dieser Reihenfolge
+    """
+    return {category: size_counts.get(category, 0) for category in SIZE_CATEGORIES}
 
 def clear_cache():
     """
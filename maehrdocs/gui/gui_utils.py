@@ -13,7 +13,7 @@ from tkinter import messagebox
 from datetime import datetime
 
 from .gui_actions import process_documents
-from .gui_logger import log_message
+from .gui_logger import log_message, update_activity_display
 
 def update_dashboard(app):
     """
@@ -46,11 +46,7 @@ def update_dashboard(app):
         app.messaging.update_status(f"Zuletzt aktualisiert: {datetime.now().strftime('%H:%M:%S')}")
         
         # Aktivitätsliste aktualisieren, wenn vorhanden
-        if "activity_list" in app.dashboard_elements:
-            app.dashboard_elements["activity_list"].config(state=tk.NORMAL)
-            app.dashboard_elements["activity_list"].delete(1.0, tk.END)
-            app.dashboard_elements["activity_list"].insert(tk.END, "Dashboard aktualisiert.")
-            app.dashboard_elements["activity_list"].config(state=tk.DISABLED)
+        update_activity_display(app, "Dashboard aktualisiert.")
 
 def open_folder_in_explorer(app, folder_suffix):
     """
@@ -130,6 +126,7 @@ def clear_log(app):
         if confirm:
             app.log_text.config(state=tk.NORMAL)
             app.log_text.delete(1.0, tk.END)
+            app.log_text._line_count = 0
             app.log_text.config(state=tk.DISABLED)
             app.messaging.notify("Protokoll gelöscht.")
     
@@ -157,7 +154,7 @@ def check_for_new_documents(app):
             app.messaging.notify(f"Eingangsordner erstellt: {inbox_dir}", level="info")
             
         # Zähle PDF-Dateien
-        pdf_count = len([f for f in os.listdir(inbox_dir) if f.lower().endswith('.pdf')])
+        pdf_count = get_file_count(inbox_dir)
         
         # Initialisieren, falls noch nicht geschehen
         if not hasattr(app, 'last_inbox_count'):
@@ -223,8 +220,10 @@ def get_file_count(directory, extension='.pdf'):
     """
     if not os.path.exists(directory):
         return 0
-        
-    return len([f for f in os.listdir(directory) if f.lower().endswith(extension.lower())])
+    
+    extension = extension.lower()
+    with os.scandir(directory) as entries:
+        return sum(1 for entry in entries if entry.name.lower().endswith(extension))
 
 def format_timestamp():
     """
@@ -294,20 +293,13 @@ def update_dashboard(app):
         app.dashboard_elements["trash_card"].count_value.config(text=str(trash_count))
         app.dashboard_elements["trash_card"].path_value.config(text=trash_path)
         
-        # NEU: Wenn das Statistik-Panel vorhanden ist, Charts aktualisieren
-        if "statistics_panel" in app.dashboard_elements:
-            # Finde die StatisticsPanel-Instanz über das Frame
-            for widget in app.dashboard_elements["statistics_panel"].master.winfo_children():
-                if hasattr(widget, 'update_charts'):
-                    widget.update_charts()
-                    break
+        # NEU: Wenn das Statistik-Panel vorhanden ist, Daten neu laden und Charts aktualisieren
+        stats_panel = app.dashboard_elements.get("stats_panel")
+        if stats_panel is not None:
+            stats_panel.refresh()
         
         # Letzte Verarbeitungszeit aktualisieren
         app.messaging.update_status(f"Zuletzt aktualisiert: {datetime.now().strftime('%H:%M:%S')}")
         
         # Aktivitätsliste aktualisieren, wenn vorhanden
-        if "activity_list" in app.dashboard_elements:
-            app.dashboard_elements["activity_list"].config(state=tk.NORMAL)
-            app.dashboard_elements["activity_list"].delete(1.0, tk.END)
-            app.dashboard_elements["activity_list"].insert(tk.END, "Dashboard aktualisiert.")
-            app.dashboard_elements["activity_list"].config(state=tk.DISABLED)
\ No newline at end of file
+        update_activity_display(app, "Dashboard aktualisiert.")
\ No newline at end of file
@@ -4,10 +4,49 @@ Konfiguriert das Python-Logging-Modul basierend auf den Anwendungseinstellungen.
 """
 
 import os
+import atexit
+import queue
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 from datetime import datetime
 
+# Hintergrund-Listener, der die Datei-Handler bedient (None, solange nicht gestartet)
+_queue_listener = None
+
+def start_queue_listener(*handlers):
+    """
+    Startet einen QueueListener, der die übergebenen Handler in einem
+    Hintergrund-Thread bedient, und liefert den passenden QueueHandler.
+    
+    Args:
+        handlers: Handler, deren Schreibzugriffe ausgelagert werden sollen
+        
+    Returns:
+        logging.handlers.QueueHandler: Handler für den Logger
+    """
+    global _queue_listener
+    
+    # Einen eventuell laufenden Listener zuerst leeren und beenden
+    stop_queue_listener()
+    
+    log_queue = queue.Queue(-1)
+    _queue_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
+    
+    return QueueHandler(log_queue)
+
+def stop_queue_listener():
+    """
+    Beendet den Hintergrund-Listener und schreibt ausstehende Einträge.
+    """
+    global _queue_listener
+    
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+atexit.register(stop_queue_listener)
+
 def setup_logging(config):
     """
     Richtet das Logging basierend auf der Konfiguration ein.
@@ -14,20 +14,25 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 parent_dir = os.path.dirname(current_dir)
 sys.path.insert(0, parent_dir)
 
-# Logging einrichten
+# Logging vor dem Import des Pakets einrichten, damit auch Importfehler
+# (z.B. fehlende Abhängigkeiten) in maehrdocs.log landen
+file_handler = logging.FileHandler('maehrdocs.log', encoding='utf-8')
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('maehrdocs.log', encoding='utf-8')
-    ]
+    handlers=[logging.StreamHandler(), file_handler]
 )
 
 # Importiere notwendige Module
 try:
     from maehrdocs import ConfigManager, DocumentProcessor
     from maehrdocs.gui import GuiApp
+    from maehrdocs.logging_setup import start_queue_listener
+    
+    # Die Datei ab jetzt über einen Hintergrund-Thread schreiben
+    root_logger = logging.getLogger()
+    root_logger.removeHandler(file_handler)
+    root_logger.addHandler(start_queue_listener(file_handler))
 except ImportError as e:
     logging.error(f"Fehler beim Importieren der Module: {str(e)}")
     print(f"Fehler: {str(e)}")
@@ -0,0 +1,61 @@
+"""
+Tests für das Laden und Zwischenspeichern der Konfiguration (config_core)
+"""
+
+import os
+
+import pytest
+
+from maehrdocs import config_core
+from maehrdocs.config_core import ConfigManager
+
+
+@pytest.fixture
+def config_manager(tmp_path):
+    """Frischer ConfigManager für eine Konfigurationsdatei im temporären Ordner"""
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("paths:\n  output_dir: ausgabe\n", encoding="utf-8")
+    
+    ConfigManager._instance = None
+    config_core._CONFIG_CACHE.clear()
+    yield ConfigManager(str(config_path))
+    ConfigManager._instance = None
+    config_core._CONFIG_CACHE.clear()
+
+
+def test_reload_ignores_unsaved_changes(config_manager):
+    """Änderungen an der ausgegebenen Konfiguration gelangen nicht in den Cache"""
+    config = config_manager.get_config()
+    config["paths"]["output_dir"] = "geaendert"
+    
+    reloaded = config_manager.reload_config()
+    assert reloaded["paths"]["output_dir"] == "ausgabe"
+    assert reloaded is not config
+
+
+def test_reload_returns_saved_config(config_manager):
+    config = config_manager.get_config()
+    config["paths"]["output_dir"] = "neu"
+    assert config_manager.save_config(config)
+    
+    # Spätere Änderungen am gespeicherten Objekt verändern den Cache nicht
+    config["paths"]["output_dir"] = "nicht gespeichert"
+    assert config_manager.reload_config()["paths"]["output_dir"] == "neu"
+
+
+def test_reload_picks_up_external_changes(config_manager):
+    config_manager.get_config()
+    
+    # Größe und Änderungszeit ändern sich, der Cache-Schlüssel damit auch
+    with open(config_manager.config_path, "w", encoding="utf-8") as file:
+        file.write("paths:\n  output_dir: extern geaendert\n")
+    stat = os.stat(config_manager.config_path)
+    os.utime(config_manager.config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    
+    assert config_manager.reload_config()["paths"]["output_dir"] == "extern geaendert"
+
+
+def test_load_writes_no_snapshot(config_manager, tmp_path):
+    """Neben der YAML-Datei entsteht keine weitere Datei (kein Pickle-Snapshot)"""
+    config_manager.get_config()
+    assert sorted(os.listdir(tmp_path)) == ["config.yaml"]
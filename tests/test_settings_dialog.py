@@ -0,0 +1,74 @@
+"""
+Tests für das Speichern der Einstellungen (gui_settings_dialog)
+"""
+
+import pytest
+
+from maehrdocs.gui import gui_settings_dialog
+from maehrdocs.gui.gui_settings_dialog import save_settings
+
+
+class _Field:
+    """Textfeld mit festem Wert und zerlegtem Konfigurationsschlüssel"""
+    field_type = 'text'
+    
+    def __init__(self, key_parts, value):
+        self._key_parts = key_parts
+        self.value = value
+    
+    def get(self):
+        return self.value
+
+
+class _ConfigManager:
+    """Speichert eine Kopie der Konfiguration, solange writable gesetzt ist"""
+    def __init__(self):
+        self.writable = True
+        self.saved = None
+    
+    def save_config(self, config):
+        if not self.writable:
+            return False
+        self.saved = {"paths": dict(config["paths"])}
+        return True
+
+
+class _Window:
+    def withdraw(self):
+        pass
+
+
+class _App:
+    """Minimale App mit den Attributen, die save_settings verwendet"""
+    def __init__(self, fields):
+        self.config = {"paths": {"output_dir": "ausgabe"}}
+        self._settings_fields = fields
+        self.config_manager = _ConfigManager()
+    
+    def log(self, message, level="info"):
+        pass
+    
+    def update_dashboard(self):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def silent_messagebox(monkeypatch):
+    """Dialoge durch No-ops ersetzen (kein Display nötig)"""
+    monkeypatch.setattr(gui_settings_dialog.messagebox, "showerror", lambda *args: None)
+    monkeypatch.setattr(gui_settings_dialog.messagebox, "showinfo", lambda *args: None)
+
+
+def test_retry_after_failed_save_stores_value():
+    """Nach einem fehlgeschlagenen Speichern landet der Wert beim erneuten Versuch in app.config"""
+    field = _Field(("paths", "output_dir"), "neu")
+    app = _App([field])
+    
+    app.config_manager.writable = False
+    save_settings(app, _Window())
+    assert app.config == {"paths": {"output_dir": "ausgabe"}}
+    
+    app.config_manager.writable = True
+    save_settings(app, _Window())
+    assert app.config["paths"]["output_dir"] == "neu"
+    assert app.config_manager.saved == {"paths": {"output_dir": "neu"}}
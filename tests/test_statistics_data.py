@@ -0,0 +1,129 @@
+"""
+Tests für die Datensammlung der Statistikvisualisierung (gui_statistics_data)
+"""
+
+import time
+
+import pytest
+
+from maehrdocs.gui import gui_statistics_data
+from maehrdocs.gui.gui_statistics_data import (
+    DocumentInfo,
+    categorize_size,
+    clear_cache,
+    collect_data,
+    extract_document_info
+)
+
+MB = 1024 * 1024
+
+
+@pytest.mark.parametrize("filename, expected", [
+    ("scan.pdf", DocumentInfo("Unbekannt", "Unbekannt", None, "Unbekannt")),
+    ("2024-01-15_Rechnung.pdf", DocumentInfo("Rechnung", "Unbekannt", "2024-01-15", "Unbekannt")),
+    ("2024-01-15_Rechnung_Telekom.pdf", DocumentInfo("Rechnung", "Telekom", "2024-01-15", "Unbekannt")),
+    ("2024-01-15_Rechnung_Telekom_Mobilfunk.pdf", DocumentInfo("Rechnung", "Telekom", "2024-01-15", "Mobilfunk")),
+    ("2024-01-15_Rechnung_Telekom_Mobilfunk_Januar.pdf",
+     DocumentInfo("Rechnung", "Telekom", "2024-01-15", "Mobilfunk_Januar")),
+])
+def test_extract_document_info_parts(filename, expected):
+    """Fehlende Teile werden 'Unbekannt', der Betreff behält weitere Unterstriche"""
+    assert extract_document_info(filename) == expected
+
+
+def test_extract_document_info_uppercase_extension():
+    """Die Endung wird unabhängig von der Schreibweise entfernt"""
+    info = extract_document_info("2024-01-15_Vertrag_Stadtwerke_Strom.PDF")
+    assert info == DocumentInfo("Vertrag", "Stadtwerke", "2024-01-15", "Strom")
+
+
+def test_extract_document_info_three_parts_sender_without_extension():
+    """Bei drei Teilen steht der Absender am Ende; er enthält die Endung nicht"""
+    info = extract_document_info("2024-01-15_Rechnung_Telekom.pdf")
+    assert info.sender == "Telekom"
+    assert info.sender != "Telekom.pdf"
+    assert info.subject == "Unbekannt"
+
+
+def test_extract_document_info_without_date():
+    """Ein erster Teil ohne Datumsformat liefert kein Datum"""
+    info = extract_document_info("Scan_Rechnung_Telekom.pdf")
+    assert info.date is None
+    assert info.type == "Rechnung"
+
+
+def test_extract_document_info_is_immutable():
+    """Gecachte Ergebnisse können von Aufrufern nicht verändert werden"""
+    info = extract_document_info("2024-01-15_Rechnung_Telekom_Mobilfunk.pdf")
+    assert extract_document_info("2024-01-15_Rechnung_Telekom_Mobilfunk.pdf") is info
+    with pytest.raises(AttributeError):
+        info.type = "Brief"
+
+
+@pytest.mark.parametrize("size_bytes, expected", [
+    (0, "<0.5 MB"),
+    (MB // 2 - 1, "<0.5 MB"),
+    (MB // 2, "0.5-1 MB"),
+    (MB - 1, "0.5-1 MB"),
+    (MB, "1-5 MB"),
+    (5 * MB - 1, "1-5 MB"),
+    (5 * MB, ">5 MB"),
+])
+def test_categorize_size_boundaries(size_bytes, expected):
+    """Jede Grenze gehört bereits zur nächstgrößeren Kategorie"""
+    assert categorize_size(size_bytes) == expected
+
+
+class _App:
+    """Minimale App mit der Konfiguration, die collect_data liest"""
+    def __init__(self, output_dir):
+        self.config = {"paths": {"output_dir": str(output_dir)}}
+
+
+@pytest.fixture
+def output_app(tmp_path):
+    """Ausgabeordner mit zwei Dokumenten und leerem Datencache"""
+    for name in ("2024-01-15_Rechnung_Telekom_Januar.pdf", "2024-02-01_Vertrag_Stadtwerke_Strom.pdf"):
+        (tmp_path / name).write_bytes(b"%PDF")
+    clear_cache()
+    yield _App(tmp_path)
+    clear_cache()
+
+
+def test_collect_data_reuses_cache_while_folder_unchanged(output_app):
+    first = collect_data(output_app)
+    assert collect_data(output_app) is first
+    assert first["types"] == {"Rechnung": 1, "Vertrag": 1}
+
+
+def test_collect_data_rescans_after_folder_change(output_app, tmp_path):
+    first = collect_data(output_app)
+    (tmp_path / "2024-03-01_Rechnung_Telekom_Maerz.pdf").write_bytes(b"%PDF")
+    
+    second = collect_data(output_app)
+    assert second is not first
+    assert second["types"] == {"Rechnung": 2, "Vertrag": 1}
+
+
+def test_collect_data_rescans_after_ttl(output_app, monkeypatch):
+    first = collect_data(output_app)
+    
+    later = time.monotonic() + gui_statistics_data._CACHE_TTL + 1
+    monkeypatch.setattr(gui_statistics_data.time, "monotonic", lambda: later)
+    assert collect_data(output_app) is not first
+
+
+def test_clear_cache_forces_rescan(output_app):
+    first = collect_data(output_app)
+    clear_cache()
+    assert collect_data(output_app) is not first
+
+
+def test_collect_data_cache_is_bounded(output_app):
+    # Unbekannte Zeiträume filtern nicht, belegen aber eigene Cache-Einträge
+    periods = [f"Zeitraum {index}" for index in range(gui_statistics_data._CACHE_MAX_ENTRIES + 1)]
+    results = [collect_data(output_app, period) for period in periods]
+    
+    assert len(gui_statistics_data._data_cache) == gui_statistics_data._CACHE_MAX_ENTRIES
+    assert periods[0] not in gui_statistics_data._data_cache
+    assert collect_data(output_app, periods[-1]) is results[-1]